@@ -49,14 +49,6 @@ class SimpleArUcoDetector:
         self.aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
         self.aruco_params = cv2.aruco.DetectorParameters()
         self.detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.aruco_params)
-        
-        # Camera matrix (simplified - adjust for your camera)
-        self.camera_matrix = np.array([
-            [800, 0, 640],
-            [0, 800, 360],
-            [0, 0, 1]
-        ], dtype=float)
-        self.dist_coeffs = np.zeros((4,1))
     
     def detect_markers(self, frame):
         """Detect ArUco markers in frame."""
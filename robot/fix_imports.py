@@ -20,6 +20,7 @@ def fix_imports_in_file(filepath):
     replacements = [
         (r'from \.camera import', 'from camera import'),
         (r'from \.aruco_center_demo import', 'from aruco_center_demo import'),
+        (r'from \.aruco_detector import', 'from aruco_detector import'),
         (r'from \.camera_config import', 'from camera_config import'),
         (r'from \.pins import', 'from pins import'),
         (r'from \.motor_gpiozero import', 'from motor_gpiozero import'),
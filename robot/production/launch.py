@@ -6,6 +6,7 @@ Production-ready robot control system
 
 import sys
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 # Get the absolute paths
@@ -26,40 +27,36 @@ print(f"  GUI: {gui_dir}")
 
 def main():
     """Main entry point."""
-    try:
-        # Check for required dependencies
-        import tkinter
+    # Check for required dependencies without importing them; the GUI
+    # module loads each of these exactly once when it is imported below
+    if find_spec("tkinter") is not None:
         print("[OK] Tkinter available")
-    except ImportError:
+    else:
         print("[ERROR] Tkinter not found. Please install python3-tk")
         return 1
     
-    try:
-        import cv2
+    if find_spec("cv2") is not None:
         print("[OK] OpenCV available")
-    except ImportError:
+    else:
         print("[WARNING] OpenCV not found. Vision features will be disabled")
     
-    try:
-        import numpy
+    if find_spec("numpy") is not None:
         print("[OK] NumPy available")
-    except ImportError:
+    else:
         print("[ERROR] NumPy not found. Please install numpy")
         return 1
     
-    try:
-        from PIL import Image
+    if find_spec("PIL") is not None:
         print("[OK] PIL available")
-    except ImportError:
+    else:
         print("[ERROR] PIL not found. Please install pillow")
         return 1
     
     # Check hardware availability
-    try:
-        from gpiozero import Device
+    if find_spec("gpiozero") is not None:
         print("[OK] Hardware interface available")
         mode = "Hardware"
-    except ImportError:
+    else:
         print("[WARNING] Hardware interface not available. Running in simulation mode")
         mode = "Simulation"
     
@@ -63,8 +63,8 @@ def calibrate_focal_length():
                 samples = []
                 
                 for _ in range(10):  # Take 10 samples
-                    frame, _ = camera.capture_frame()
-                    markers = detector.detect_markers(frame)
+                    gray, _ = camera.capture_gray()
+                    markers = detector.detect_markers(gray)
                     
                     if markers:
                         # Use first marker found
@@ -133,8 +133,8 @@ def calibrate_focal_length():
                 detector.camera_matrix[1, 1] = test_fl
                 
                 while True:
-                    frame, _ = camera.capture_frame()
-                    markers = detector.detect_markers(frame)
+                    gray, _ = camera.capture_gray()
+                    markers = detector.detect_markers(gray)
                     
                     if markers:
                         for marker_id, marker in markers.items():
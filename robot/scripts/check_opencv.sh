@@ -41,6 +41,7 @@ echo "Option 1: Update via pip (recommended for latest version):"
 echo "  pip3 install --upgrade opencv-python opencv-contrib-python"
 echo ""
 echo "Option 2: Build from source for Raspberry Pi optimization:"
+echo "  ./scripts/build_opencv_pi5.sh   # NEON, -mcpu=cortex-a76, LTO"
 echo "  See: https://docs.opencv.org/4.x/d7/d9f/tutorial_linux_install.html"
 echo ""
 echo "Option 3: Use system packages (may be older):"
@@ -4,11 +4,13 @@
 import sys
 import time
 import logging
+from typing import TYPE_CHECKING
 
 # Add parent directory to path
 sys.path.append('..')
 
-from src.aruco_navigation import ArUcoNavigator
+if TYPE_CHECKING:
+    from src.aruco_navigation import ArUcoNavigator
 
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,7 +23,11 @@ MARKER_DELIVERY_A = 2
 MARKER_DELIVERY_B = 3
 MARKER_CHARGING = 4
 
-def run_delivery_cycle(navigator: ArUcoNavigator):
+# Stations that must have a saved position before a delivery cycle can run
+REQUIRED_MARKERS = frozenset({MARKER_HOME, MARKER_PICKUP,
+                              MARKER_DELIVERY_A, MARKER_DELIVERY_B})
+
+def run_delivery_cycle(navigator: 'ArUcoNavigator'):
     """Run a complete delivery cycle."""
     
     logger.info("=== Starting Beverage Delivery Cycle ===")
@@ -71,7 +77,7 @@ def run_delivery_cycle(navigator: ArUcoNavigator):
     logger.info("=== Delivery Cycle Complete ===")
     return True
 
-def setup_demo_positions(navigator: ArUcoNavigator):
+def setup_demo_positions(navigator: 'ArUcoNavigator'):
     """Interactive setup for demo positions."""
     
     print("\n=== Demo Setup Wizard ===")
@@ -128,6 +134,9 @@ def main():
     
     args = parser.parse_args()
     
+    # Imported here so --help does not pull in OpenCV and the motor stack
+    from src.aruco_navigation import ArUcoNavigator
+    
     # Initialize navigator
     print("Initializing BevBot navigation system...")
     navigator = ArUcoNavigator()
@@ -144,14 +153,10 @@ def main():
                 return 1
         else:
             # Check if positions are configured
-            required_markers = [MARKER_HOME, MARKER_PICKUP, 
-                              MARKER_DELIVERY_A, MARKER_DELIVERY_B]
-            
-            missing = [m for m in required_markers 
-                      if m not in navigator.saved_positions]
+            missing = REQUIRED_MARKERS - navigator.saved_positions.keys()
             
             if missing:
-                print(f"Missing positions for markers: {missing}")
+                print(f"Missing positions for markers: {sorted(missing)}")
                 print("Run with --setup to configure positions")
                 return 1
             
@@ -0,0 +1,85 @@
+#!/bin/bash
+# Profile BevBot startup imports with python -X importtime
+#
+# Usage:
+#   ./scripts/profile_imports.sh                  # Profile production/launch.py
+#   ./scripts/profile_imports.sh src.aruco_navigation
+#   IMPORT_BUDGET_MS=250 ./scripts/profile_imports.sh
+#
+# Prints the slowest imports (or opens tuna if installed with --tuna) and
+# exits non-zero when the target module exceeds the import-time budget.
+
+cd "$(dirname "$0")/.." || exit 1
+
+TARGET="launch"
+USE_TUNA=false
+BUDGET_MS="${IMPORT_BUDGET_MS:-400}"
+TOP_N="${IMPORT_TOP_N:-20}"
+
+while [[ $# -gt 0 ]]; do
+    case $1 in
+        --tuna)
+            USE_TUNA=true
+            shift
+            ;;
+        --help|-h)
+            echo "Usage: $0 [--tuna] [module]"
+            echo ""
+            echo "  module    Module to import (default: launch from production/)"
+            echo "  --tuna    Visualize the profile with tuna instead of printing"
+            echo ""
+            echo "Environment:"
+            echo "  IMPORT_BUDGET_MS   Fail when the module takes longer (default: 400)"
+            echo "  IMPORT_TOP_N       Number of slowest imports to show (default: 20)"
+            exit 0
+            ;;
+        *)
+            TARGET="$1"
+            shift
+            ;;
+    esac
+done
+
+PROFILE="$(mktemp /tmp/bevbot_importtime.XXXXXX)"
+trap 'rm -f "$PROFILE"' EXIT
+
+export PYTHONPATH="$(pwd):$(pwd)/production:$PYTHONPATH"
+python3 -X importtime -c "import $TARGET" > /dev/null 2> "$PROFILE"
+if [ $? -ne 0 ]; then
+    echo "❌ Failed to import $TARGET"
+    grep -v "^import time:" "$PROFILE"
+    exit 1
+fi
+
+if [ "$USE_TUNA" = true ]; then
+    if python3 -c "import tuna" 2>/dev/null; then
+        python3 -m tuna "$PROFILE"
+    else
+        echo "tuna not installed. Install with: pip3 install tuna"
+        exit 1
+    fi
+fi
+
+echo "=== Slowest imports for $TARGET (cumulative) ==="
+grep "^import time:" "$PROFILE" | tail -n +2 \
+    | sort -t'|' -k2 -n -r | head -n "$TOP_N"
+echo ""
+
+# The target module is reported last, its cumulative time covers everything
+TOTAL_US=$(grep "^import time:" "$PROFILE" | grep -E "\| +$TARGET$" \
+    | tail -n 1 | awk -F'|' '{gsub(/ /, "", $2); print $2}')
+
+if [ -z "$TOTAL_US" ]; then
+    echo "Could not find $TARGET in import profile"
+    exit 1
+fi
+
+TOTAL_MS=$((TOTAL_US / 1000))
+echo "Total import time for $TARGET: ${TOTAL_MS}ms (budget ${BUDGET_MS}ms)"
+
+if [ "$TOTAL_MS" -gt "$BUDGET_MS" ]; then
+    echo "❌ Import time budget exceeded"
+    exit 1
+fi
+
+echo "✓ Within budget"
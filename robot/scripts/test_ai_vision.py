@@ -5,7 +5,6 @@ import sys
 import os
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
-import cv2
 import numpy as np
 import json
 from src.openai_vision import OpenAIVision, VisionAnalysis
@@ -27,6 +26,7 @@ def test_api_key():
 def test_image_encoding(vision):
     """Test image encoding."""
     print("\nTesting image encoding...")
+    import cv2
     # Create a test image
     test_image = np.zeros((480, 640, 3), dtype=np.uint8)
     cv2.putText(test_image, "TEST IMAGE", (200, 240),
@@ -65,6 +65,7 @@ def test_surroundings_analysis(vision):
     """Test surroundings analysis with multiple images."""
     print("\nTesting surroundings analysis...")
 
+    import cv2
     # Create multiple test images
     images = []
     for i in range(4):
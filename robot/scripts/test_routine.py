@@ -1,14 +1,21 @@
 #!/usr/bin/env python3
-"""Test script for the new routine system."""
+"""Test script for the new routine system.
 
-import sys
+Run as a module from the robot directory so the src package resolves
+without path manipulation:
+
+    python3 -m scripts.test_routine [--list | --routine NAME | ...]
+
+or use scripts/test_routine.sh.
+"""
+
+import cmd
+import re
 import time
 import logging
 import argparse
 from pathlib import Path
-
-# Add parent directory to path
-sys.path.append(str(Path(__file__).parent.parent))
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
 
 # Setup logging first
 logging.basicConfig(
@@ -17,30 +24,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-from src.robot_controller import RobotController
-
-# Try to import camera and ArUco components
 try:
-    from src.camera import CameraInterface
-    from src.aruco_center_demo import ArUcoDetector
-    from src.camera_config import MARKER_SIZE_CM
-    CAMERA_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Camera/ArUco libraries not available: {e}")
-    CAMERA_AVAILABLE = False
-    CameraInterface = None
-    ArUcoDetector = None
-    MARKER_SIZE_CM = 10  # Default value
-from src.routine_system import RoutineContext, RoutineExecutor
-from src.routine_factory import RoutineManager, ActionFactory
+    import readline
+except ImportError:
+    readline = None
 
-try:
-    from src.routine_navigator import RoutineNavigator
-    NAVIGATOR_AVAILABLE = True
-except ImportError as e:
-    logger.warning(f"Navigator not available: {e}")
-    NAVIGATOR_AVAILABLE = False
-    RoutineNavigator = None
+# Interactive shell history, kept across sessions
+HISTORY_FILE = str(Path.home() / ".bevbot_history")
+HISTORY_LENGTH = 1000
+
+# Hardware, camera and ArUco modules (gpiozero, OpenCV) are imported in
+# RoutineTestSystem.__init__ so file-only commands like --list stay light
+from src.routine_system import Routine, RoutineBuilder, RoutineContext, RoutineExecutor
+from src.routine_factory import RoutineManager, ActionFactory
 from src.routine_examples import (
     create_fridge_open_routine,
     create_beverage_pickup_routine,
@@ -51,6 +47,84 @@ from src.routine_examples import (
     save_all_examples
 )
 
+# Example routines that can be run without being saved first
+EXAMPLE_ROUTINES: Dict[str, Callable[[], Routine]] = {
+    "fridge_open": create_fridge_open_routine,
+    "beverage_pickup": create_beverage_pickup_routine,
+    "delivery": create_delivery_routine,
+    "patrol": create_patrol_routine,
+    "conditional_delivery": create_conditional_delivery_routine,
+    "approach_demo": create_approach_demo_routine,
+}
+
+# Argument patterns for the custom routine builder
+_NUM = r"(-?\d+(?:\.\d+)?)"
+_INT = r"(-?\d+)"
+_OPT_NUM = r"(?:\s+" + _NUM + r")?"
+
+# Captured argument groups, None for omitted optional arguments
+ActionArgs = Tuple[Optional[str], ...]
+ActionHandler = Callable[[RoutineBuilder, ActionArgs], None]
+
+def _do_move(builder: RoutineBuilder, args: ActionArgs):
+    builder.move(float(args[0]), float(args[1]), float(args[2]))
+
+def _do_turn(builder: RoutineBuilder, args: ActionArgs):
+    speed = float(args[1]) if args[1] is not None else 30
+    builder.turn(float(args[0]), speed)
+
+def _do_actuator(builder: RoutineBuilder, args: ActionArgs):
+    duration = float(args[1]) if args[1] is not None else 0
+    speed = float(args[2]) if args[2] is not None else 50
+    builder.actuator(args[0].lower(), duration, speed)
+
+def _do_wait(builder: RoutineBuilder, args: ActionArgs):
+    builder.wait(float(args[0]))
+
+def _do_search(builder: RoutineBuilder, args: ActionArgs):
+    timeout = float(args[1]) if args[1] is not None else 10
+    builder.search_for_marker(int(args[0]), timeout)
+
+def _do_navigate(builder: RoutineBuilder, args: ActionArgs):
+    distance = float(args[1]) if args[1] is not None else 30
+    builder.navigate_to_marker(int(args[0]), distance)
+
+# Custom routine builder verbs: (compiled argument pattern, handler).
+# Patterns only match well-formed numbers, so handlers never raise on
+# conversion and unmatched lines are rejected up front. Handlers are plain
+# module-level functions so a lookup never builds a closure
+ACTION_SPECS: Dict[str, Tuple[Pattern[str], ActionHandler]] = {
+    "move": (re.compile(_NUM + r"\s+" + _NUM + r"\s+" + _NUM), _do_move),
+    "turn": (re.compile(_NUM + _OPT_NUM), _do_turn),
+    "actuator": (re.compile(r"(extend|retract|stop)" + _OPT_NUM + _OPT_NUM, re.IGNORECASE),
+                 _do_actuator),
+    "wait": (re.compile(_NUM), _do_wait),
+    "search": (re.compile(_INT + _OPT_NUM), _do_search),
+    "navigate": (re.compile(_INT + _OPT_NUM), _do_navigate),
+}
+
+def print_routines(saved: List[str]):
+    """Print saved and example routine names.
+    
+    Args:
+        saved: Names of routines saved in the routines directory
+    """
+    print("\nAvailable Routines:")
+    print("-" * 40)
+    
+    # List saved routines
+    if saved:
+        print("Saved routines:")
+        for i, name in enumerate(saved, 1):
+            print(f"  {i}. {name}")
+    else:
+        print("No saved routines found")
+    
+    # List example routines
+    print("\nExample routines (not saved):")
+    for i, name in enumerate(EXAMPLE_ROUTINES, 1):
+        print(f"  {i}. {name}")
+
 class RoutineTestSystem:
     """System for testing and running routines."""
     
@@ -58,6 +132,25 @@ class RoutineTestSystem:
         """Initialize test system."""
         logger.info("Initializing routine test system...")
         
+        from src.robot_controller import RobotController
+        
+        # Try to import camera and ArUco components
+        try:
+            from src.camera import CameraInterface
+            from src.aruco_center_demo import ArUcoDetector
+            from src.camera_config import MARKER_SIZE_CM
+            camera_available = True
+        except ImportError as e:
+            logger.warning(f"Camera/ArUco libraries not available: {e}")
+            camera_available = False
+        
+        try:
+            from src.routine_navigator import RoutineNavigator
+            navigator_available = True
+        except ImportError as e:
+            logger.warning(f"Navigator not available: {e}")
+            navigator_available = False
+        
         # Initialize hardware
         self.robot = RobotController()
         
@@ -66,7 +159,7 @@ class RoutineTestSystem:
         self.detector = None
         self.navigator = None
         
-        if CAMERA_AVAILABLE and NAVIGATOR_AVAILABLE:
+        if camera_available and navigator_available:
             try:
                 self.camera = CameraInterface()
                 self.detector = ArUcoDetector(marker_size_cm=MARKER_SIZE_CM)
@@ -74,6 +167,9 @@ class RoutineTestSystem:
                 # Check camera
                 if self.camera.is_available():
                     self.camera.start()
+                    # Capture in the background so navigation ticks only
+                    # pick up the newest frame
+                    self.camera.start_async()
                     # Create navigator
                     self.navigator = RoutineNavigator(self.robot, self.camera, self.detector)
                     logger.info("Camera and navigator initialized")
@@ -86,9 +182,9 @@ class RoutineTestSystem:
                 self.camera = None
                 self.detector = None
         else:
-            if not CAMERA_AVAILABLE:
+            if not camera_available:
                 logger.warning("Camera libraries not available, navigation features disabled")
-            if not NAVIGATOR_AVAILABLE:
+            if not navigator_available:
                 logger.warning("Navigator not available, ArUco navigation disabled")
         
         # Create routine context
@@ -104,34 +200,24 @@ class RoutineTestSystem:
         # Create routine manager
         self.manager = RoutineManager()
         
+        # (routines_dir mtime, names) from the last directory scan
+        self._routines_cache = (None, None)
+        
         logger.info("System initialized")
     
+    def _saved_routines(self) -> List[str]:
+        """Get saved routine names, rescanning only when the directory changed."""
+        mtime = self.manager.routines_dir.stat().st_mtime_ns
+        if mtime == self._routines_cache[0]:
+            return self._routines_cache[1]
+        
+        names = self.manager.list_routines()
+        self._routines_cache = (mtime, names)
+        return names
+    
     def list_routines(self):
         """List available routines."""
-        print("\nAvailable Routines:")
-        print("-" * 40)
-        
-        # List saved routines
-        saved = self.manager.list_routines()
-        if saved:
-            print("Saved routines:")
-            for i, name in enumerate(saved, 1):
-                print(f"  {i}. {name}")
-        else:
-            print("No saved routines found")
-        
-        # List example routines
-        print("\nExample routines (not saved):")
-        examples = [
-            "fridge_open",
-            "beverage_pickup",
-            "delivery",
-            "patrol",
-            "conditional_delivery",
-            "approach_demo"
-        ]
-        for i, name in enumerate(examples, 1):
-            print(f"  {i}. {name}")
+        print_routines(self._saved_routines())
     
     def run_routine(self, routine_name: str):
         """Run a specific routine.
@@ -147,162 +233,50 @@ class RoutineTestSystem:
             # Try to create example routine
             logger.info(f"Creating example routine: {routine_name}")
             
-            if routine_name == "fridge_open":
-                routine = create_fridge_open_routine()
-            elif routine_name == "beverage_pickup":
-                routine = create_beverage_pickup_routine()
-            elif routine_name == "delivery":
-                routine = create_delivery_routine()
-            elif routine_name == "patrol":
-                routine = create_patrol_routine()
-            elif routine_name == "conditional_delivery":
-                routine = create_conditional_delivery_routine()
-            elif routine_name == "approach_demo":
-                routine = create_approach_demo_routine()
-            else:
+            factory = EXAMPLE_ROUTINES.get(routine_name)
+            if factory is None:
                 logger.error(f"Unknown routine: {routine_name}")
                 return
+            routine = factory()
         
         # Execute routine
-        print(f"\n{'='*50}")
-        print(f"Running routine: {routine.name}")
-        print(f"Description: {routine.description}")
-        print(f"Actions: {len(routine.actions)}")
-        print(f"{'='*50}\n")
+        rule = '=' * 50
+        print(f"\n{rule}\n"
+              f"Running routine: {routine.name}\n"
+              f"Description: {routine.description}\n"
+              f"Actions: {len(routine.actions)}\n"
+              f"{rule}\n")
         
         # Run synchronously so we can monitor
         result = self.executor.execute(routine, async_exec=False)
         
         if result.success:
-            print(f"\n✓ Routine completed successfully!")
-            print(f"  Duration: {result.duration:.1f}s")
+            print(f"\n✓ Routine completed successfully!\n"
+                  f"  Duration: {result.duration:.1f}s")
         else:
-            print(f"\n✗ Routine failed!")
-            print(f"  Error: {result.message}")
+            print(f"\n✗ Routine failed!\n"
+                  f"  Error: {result.message}")
     
     def interactive_mode(self):
         """Run interactive routine testing mode."""
-        print("\n" + "="*50)
-        print("BevBot Routine System - Interactive Mode")
-        print("="*50)
-        
-        while True:
-            print("\nOptions:")
-            print("1. List available routines")
-            print("2. Run a routine")
-            print("3. Save example routines")
-            print("4. Create custom routine")
-            print("5. Stop current routine")
-            print("6. Exit")
-            
-            choice = input("\nChoice: ").strip()
-            
-            if choice == '1':
-                self.list_routines()
-            
-            elif choice == '2':
-                self.list_routines()
-                routine_name = input("\nEnter routine name: ").strip()
-                if routine_name:
-                    self.run_routine(routine_name)
-            
-            elif choice == '3':
-                print("Saving example routines...")
-                save_all_examples()
-                print("Done!")
-            
-            elif choice == '4':
-                self.create_custom_routine()
-            
-            elif choice == '5':
-                if self.executor.is_running:
-                    print("Stopping current routine...")
-                    self.executor.stop()
-                    print("Stopped")
-                else:
-                    print("No routine currently running")
-            
-            elif choice == '6':
-                print("Exiting...")
-                break
-            
-            else:
-                print("Invalid choice")
+        shell = RoutineShell(self)
+        try:
+            shell.cmdloop()
+        finally:
+            shell.save_history()
     
-    def create_custom_routine(self):
-        """Interactive custom routine builder."""
-        print("\n=== Custom Routine Builder ===")
-        
-        name = input("Routine name: ").strip()
-        if not name:
-            print("Name required")
-            return
-        
-        description = input("Description (optional): ").strip()
-        
-        from src.routine_system import RoutineBuilder
-        builder = RoutineBuilder(name, description)
-        
-        print("\nAdding actions (type 'done' to finish):")
-        print("Available actions:")
-        print("  move <left> <right> <duration>")
-        print("  turn <angle> [speed]")
-        print("  actuator <extend|retract> [duration] [speed]")
-        print("  wait <duration>")
-        print("  search <marker_id> [timeout]")
-        print("  navigate <marker_id> [distance]")
-        
-        while True:
-            action_str = input("\nAction: ").strip()
-            
-            if action_str.lower() == 'done':
-                break
-            
-            parts = action_str.split()
-            if not parts:
-                continue
-            
-            action_type = parts[0].lower()
-            
-            try:
-                if action_type == 'move' and len(parts) >= 4:
-                    builder.move(float(parts[1]), float(parts[2]), float(parts[3]))
-                
-                elif action_type == 'turn' and len(parts) >= 2:
-                    speed = float(parts[2]) if len(parts) > 2 else 30
-                    builder.turn(float(parts[1]), speed)
-                
-                elif action_type == 'actuator' and len(parts) >= 2:
-                    duration = float(parts[2]) if len(parts) > 2 else 0
-                    speed = float(parts[3]) if len(parts) > 3 else 50
-                    builder.actuator(parts[1], duration, speed)
-                
-                elif action_type == 'wait' and len(parts) >= 2:
-                    builder.wait(float(parts[1]))
-                
-                elif action_type == 'search' and len(parts) >= 2:
-                    timeout = float(parts[2]) if len(parts) > 2 else 10
-                    builder.search_for_marker(int(parts[1]), timeout)
-                
-                elif action_type == 'navigate' and len(parts) >= 2:
-                    distance = float(parts[2]) if len(parts) > 2 else 30
-                    builder.navigate_to_marker(int(parts[1]), distance)
-                
-                else:
-                    print(f"Invalid action: {action_str}")
-                    continue
-                
-                print(f"Added: {action_str}")
-                
-            except (ValueError, IndexError) as e:
-                print(f"Error parsing action: {e}")
+    def finish_custom_routine(self, builder: RoutineBuilder):
+        """Build a custom routine and optionally save and run it.
         
-        # Build and optionally save
+        Args:
+            builder: Builder holding the actions entered in the shell
+        """
         routine = builder.build()
         print(f"\nCreated routine '{routine.name}' with {len(routine.actions)} actions")
         
         if input("Save routine? (y/n): ").strip().lower() == 'y':
             filepath = self.manager.save_routine(routine)
+            self._routines_cache = (None, None)
             print(f"Saved to: {filepath}")
         
         if input("Run routine? (y/n): ").strip().lower() == 'y':
@@ -327,6 +301,156 @@ class RoutineTestSystem:
         
         logger.info("Cleanup complete")
 
+class RoutineShell(cmd.Cmd):
+    """Interactive shell for listing, running and building routines.
+    
+    Uses readline for line editing, tab completion and a history file
+    that persists across sessions.
+    """
+    
+    intro = ("\n" + "="*50 + "\nBevBot Routine System - Interactive Mode\n" + "="*50 +
+             "\nType 'help' for commands, 'new <name>' to build a routine.")
+    prompt = 'bevbot> '
+    
+    def __init__(self, system: 'RoutineTestSystem'):
+        super().__init__()
+        self.system = system
+        self.builder: Optional[RoutineBuilder] = None
+    
+    def preloop(self):
+        if readline is None:
+            return
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(HISTORY_FILE)
+        except OSError:
+            pass
+    
+    def save_history(self):
+        """Write the readline history file."""
+        if readline is None:
+            return
+        try:
+            readline.write_history_file(HISTORY_FILE)
+        except OSError as e:
+            logger.warning(f"Could not save history to {HISTORY_FILE}: {e}")
+    
+    def emptyline(self):
+        # Never repeat the last command (it may be 'run')
+        pass
+    
+    def default(self, line):
+        print(f"Unknown command: {line}")
+    
+    # Routine management
+    
+    def do_list(self, arg):
+        """list: List available routines."""
+        self.system.list_routines()
+    
+    def do_run(self, arg):
+        """run <name>: Run a saved or example routine."""
+        routine_name = arg.strip()
+        if not routine_name:
+            print("Usage: run <name>")
+            return
+        self.system.run_routine(routine_name)
+    
+    def complete_run(self, text, line, begidx, endidx):
+        names = set(EXAMPLE_ROUTINES) | set(self.system._saved_routines())
+        return sorted(name for name in names if name.startswith(text))
+    
+    def do_save_examples(self, arg):
+        """save_examples: Save example routines to the routines directory."""
+        print("Saving example routines...")
+        save_all_examples()
+        self.system._routines_cache = (None, None)
+        print("Done!")
+    
+    def do_stop(self, arg):
+        """stop: Stop the current routine."""
+        if self.system.executor.is_running:
+            print("Stopping current routine...")
+            self.system.executor.stop()
+            print("Stopped")
+        else:
+            print("No routine currently running")
+    
+    def do_exit(self, arg):
+        """exit: Leave interactive mode."""
+        print("Exiting...")
+        return True
+    
+    def do_EOF(self, arg):
+        print()
+        return self.do_exit(arg)
+    
+    # Custom routine builder
+    
+    def do_new(self, arg):
+        """new <name> [description]: Start building a custom routine."""
+        parts = arg.split(maxsplit=1)
+        if not parts:
+            print("Name required")
+            return
+        
+        name = parts[0]
+        description = parts[1] if len(parts) > 1 else ""
+        self.builder = RoutineBuilder(name, description)
+        self.prompt = f'bevbot:{name}> '
+        print("Adding actions (type 'done' to finish, 'help' for action syntax)")
+    
+    def do_done(self, arg):
+        """done: Finish the custom routine, then optionally save and run it."""
+        if self.builder is None:
+            print("No routine in progress, start one with 'new <name>'")
+            return
+        
+        builder, self.builder = self.builder, None
+        self.prompt = 'bevbot> '
+        self.system.finish_custom_routine(builder)
+    
+    def _add_action(self, verb: str, arg: str):
+        if self.builder is None:
+            print("No routine in progress, start one with 'new <name>'")
+            return
+        
+        pattern, handler = ACTION_SPECS[verb]
+        match = pattern.fullmatch(arg.strip())
+        if match is None:
+            print(f"Invalid action: {verb} {arg}")
+            return
+        
+        handler(self.builder, match.groups())
+        print(f"Added: {verb} {arg}")
+    
+    def do_move(self, arg):
+        """move <left> <right> <duration>: Drive both motors."""
+        self._add_action('move', arg)
+    
+    def do_turn(self, arg):
+        """turn <angle> [speed]: Turn in place."""
+        self._add_action('turn', arg)
+    
+    def do_actuator(self, arg):
+        """actuator <extend|retract|stop> [duration] [speed]: Move the actuator."""
+        self._add_action('actuator', arg)
+    
+    def complete_actuator(self, text, line, begidx, endidx):
+        return [a for a in ('extend', 'retract', 'stop') if a.startswith(text)]
+    
+    def do_wait(self, arg):
+        """wait <duration>: Pause."""
+        self._add_action('wait', arg)
+    
+    def do_search(self, arg):
+        """search <marker_id> [timeout]: Rotate until a marker is seen."""
+        self._add_action('search', arg)
+    
+    def do_navigate(self, arg):
+        """navigate <marker_id> [distance]: Drive to a marker."""
+        self._add_action('navigate', arg)
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(description="BevBot Routine System Test")
@@ -337,19 +461,23 @@ def main():
     
     args = parser.parse_args()
     
+    # Listing and saving routines never touch hardware, so handle them
+    # before the camera and GPIO are brought up
+    if args.list:
+        print_routines(RoutineManager().list_routines())
+        return
+    
+    if args.save_examples:
+        print("Saving example routines...")
+        save_all_examples()
+        print("Done!")
+        return
+    
     # Create test system
     system = RoutineTestSystem()
     
     try:
-        if args.list:
-            system.list_routines()
-        
-        elif args.save_examples:
-            print("Saving example routines...")
-            save_all_examples()
-            print("Done!")
-        
-        elif args.routine:
+        if args.routine:
             system.run_routine(args.routine)
         
         elif args.interactive or not any(vars(args).values()):
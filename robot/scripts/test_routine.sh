@@ -0,0 +1,11 @@
+#!/bin/bash
+# Run the BevBot routine system test
+#
+# Usage:
+#   ./scripts/test_routine.sh                 # Interactive shell
+#   ./scripts/test_routine.sh --list
+#   ./scripts/test_routine.sh --routine patrol
+
+cd "$(dirname "$0")/.." || exit 1
+
+python3 -m scripts.test_routine "$@"
@@ -22,25 +22,38 @@ class LinearActuator:
         self._driver.disable()
         logger.info("Linear actuator disabled")
         
+    def drive(self, percent: float) -> None:
+        """Drive the actuator at a signed power.
+        
+        Args:
+            percent: Power (-100 to +100%). Positive extends, negative retracts.
+                Larger magnitudes are clamped; NaN stops the actuator.
+        """
+        if percent != percent:
+            # NaN slips through min()/max() clamps as full power
+            logger.warning("Actuator drive got NaN, stopping")
+            percent = 0.0
+        percent = max(-100.0, min(100.0, percent))
+        self._driver.drive(percent)
+        logger.debug("Actuator driving at %s%%", percent)
+        
     def extend(self, percent: float = 50.0) -> None:
         """Extend the actuator at specified power.
         
         Args:
-            percent: Extension power (0-100%). Default 50%.
+            percent: Extension power (0-100%). Default 50%. A negative value
+                is treated as its magnitude; drive() clamps to 100%.
         """
-        percent = abs(percent)  # Ensure positive
-        self._driver.drive(percent)
-        logger.debug(f"Actuator extending at {percent}%")
+        self.drive(-percent if percent < 0 else percent)
         
     def retract(self, percent: float = 50.0) -> None:
         """Retract the actuator at specified power.
         
         Args:
-            percent: Retraction power (0-100%). Default 50%.
+            percent: Retraction power (0-100%). Default 50%. A negative value
+                is treated as its magnitude; drive() clamps to 100%.
         """
-        percent = abs(percent)  # Ensure positive
-        self._driver.drive(-percent)  # Negative for reverse
-        logger.debug(f"Actuator retracting at {percent}%")
+        self.drive(percent if percent < 0 else -percent)
         
     def stop(self) -> None:
         """Stop actuator movement (coast)."""
@@ -60,7 +73,7 @@ class LinearActuator:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - ensure safe shutdown."""
         try:
-            self.stop()
-            self.disable()
+            self._driver.shutdown()
+            logger.info("Linear actuator shutdown")
         except Exception as e:
             logger.error(f"Error during actuator shutdown: {e}")
\ No newline at end of file
@@ -11,6 +11,8 @@ import time
 import json
 import os
 import sys
+import threading
+from contextlib import contextmanager
 from typing import Optional, Dict, Tuple
 from dataclasses import dataclass, asdict
 
@@ -29,9 +31,34 @@ except ImportError:
     HARDWARE_AVAILABLE = False
     print("Warning: Running in simulation mode")
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the PID step runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 from camera import CameraInterface
 from aruco_center_demo import ArUcoDetector
 
+# Saved alignment positions, one JSON object per line (last line per marker wins)
+POSITIONS_FILE = 'saved_positions.jsonl'
+# Older single-document format, still read so existing saves carry over
+LEGACY_POSITIONS_FILE = 'saved_positions.json'
+
+# PID step period (s) assumed when the camera reports no frame rate and for
+# the first step after (re)acquiring the marker; later steps use the measured
+# time between frames, capped at MAX_CONTROL_DT so a stalled camera does not
+# dump a large integral step
+DEFAULT_CONTROL_DT = 1.0 / 30.0
+MAX_CONTROL_DT = 0.2
+# Motor command changes smaller than this (percent) are not sent
+MOTOR_DEADBAND = 0.5
+# Minimum interval between status line updates (5Hz)
+PRINT_PERIOD_NS = 200_000_000
+
 @dataclass
 class AlignmentConfig:
     """Configuration for alignment behavior."""
@@ -57,6 +84,19 @@ class AlignmentConfig:
     ki_distance: float = 0.05  # Integral gain for distance
     kd_distance: float = 0.1   # Derivative gain for distance
     
+    # Low-pass weight of each new error sample before the PID (1.0 = off)
+    error_filter_alpha: float = 0.3
+    
+    # Scheduling (Linux): CPU cores for the control loop and the detection
+    # worker (-1 = any), and the control loop's SCHED_FIFO priority (0 = off)
+    control_cpu: int = 3
+    detect_cpu: int = 2
+    control_priority: int = 40
+    
+    # Detection runs on a grayscale copy downscaled to this width (0 = full
+    # resolution); results are mapped back to full-frame pixels
+    detection_width: int = 640
+    
     # Alignment verification
     required_stable_frames: int = 5  # Frames to hold position
     max_alignment_time: float = 30.0  # Maximum time to attempt alignment
@@ -69,10 +109,97 @@ class AlignmentConfig:
     @classmethod
     def load(cls, filename: str = "alignment_config.json"):
         """Load configuration from file."""
-        if os.path.exists(filename):
+        try:
             with open(filename, 'r') as f:
                 return cls(**json.load(f))
-        return cls()
+        except FileNotFoundError:
+            return cls()
+
+@njit(cache=True)
+def _pid_step(error, output, last_error, prev_error, kp, ki_t, kd_t, limit):
+    """One velocity-form PID update for a single axis.
+    
+    ki_t and kd_t are the gains already scaled by this step's period.
+    
+    u_k = u_{k-1} + Kp*(e_k - e_{k-1}) + Ki*T*e_k + Kd/T*(e_k - 2*e_{k-1} + e_{k-2})
+    
+    Returns:
+        New output, clamped to +/-limit (anti-windup)
+    """
+    output += (kp * (error - last_error) +
+               ki_t * error +
+               kd_t * (error - 2.0 * last_error + prev_error))
+    return max(-limit, min(limit, output))
+
+# _align_step state: output, last error, error before that, per axis, then
+# the filtered x/distance errors and a flag set once the filter is seeded
+PID_STATE_SIZE = 9
+FILTER_PRIMED = 8
+
+@njit(cache=True)
+def _align_step(center_x, distance, target_x, target_distance,
+                tolerance_x, tolerance_distance, dt, state, coeffs):
+    """One alignment control iteration.
+    
+    Args:
+        center_x, distance: Measured marker center (px) and distance (cm)
+        target_x, target_distance: Setpoints
+        tolerance_x, tolerance_distance: Aligned when both errors are within
+        dt: Seconds since the previous step
+        state: PID_STATE_SIZE float array, updated in place
+        coeffs: (kp_x, ki_x, kd_x, kp_d, ki_d, kd_d, output_limit,
+                 error_filter_alpha)
+    
+    Returns:
+        Tuple of (left, right, x_error, distance_error, aligned), with the
+        raw (unfiltered) errors
+    """
+    x_error = target_x - center_x
+    distance_error = target_distance - distance
+    aligned = abs(x_error) <= tolerance_x and abs(distance_error) <= tolerance_distance
+    limit = coeffs[6]
+    
+    # Low-pass the errors so marker jitter is not amplified by the D term.
+    # The first sample after a reset or re-acquisition seeds the filter and
+    # the error history, so that step has no derivative kick; the output
+    # takes the proportional change the seeding skips over
+    alpha = coeffs[7]
+    if state[FILTER_PRIMED] == 0.0:
+        state[6] = x_error
+        state[7] = distance_error
+        state[0] += coeffs[0] * (x_error - state[1])
+        state[3] += coeffs[3] * (distance_error - state[4])
+        state[1] = state[2] = x_error
+        state[4] = state[5] = distance_error
+        state[FILTER_PRIMED] = 1.0
+    else:
+        state[6] += alpha * (x_error - state[6])
+        state[7] += alpha * (distance_error - state[7])
+    
+    x_control = _pid_step(state[6], state[0], state[1], state[2],
+                          coeffs[0], coeffs[1] * dt, coeffs[2] / dt, limit)
+    state[0] = x_control
+    state[2] = state[1]
+    state[1] = state[6]
+    
+    # Steering gets priority: the distance output only uses the headroom
+    # left, so neither motor command saturates in set_motors and the stored
+    # outputs (the velocity form's integrators) always match what was applied
+    distance_control = _pid_step(state[7], state[3], state[4], state[5],
+                                 coeffs[3], coeffs[4] * dt, coeffs[5] / dt,
+                                 limit - abs(x_control))
+    state[3] = distance_control
+    state[5] = state[4]
+    state[4] = state[7]
+    
+    # Combine controls
+    return (distance_control - x_control, distance_control + x_control,
+            x_error, distance_error, aligned)
+
+def _index_of(ids: np.ndarray, marker_id: int) -> int:
+    """Row of marker_id in a detection's ids array, or -1 if not detected."""
+    hits = np.flatnonzero(ids == marker_id)
+    return int(hits[0]) if hits.size else -1
 
 class SimpleAligner:
     """Simplified alignment system optimized for Pi 5."""
@@ -84,24 +211,59 @@ class SimpleAligner:
         self.left_motor = None
         self.right_motor = None
         
-        # PID state
-        self.x_integral = 0
-        self.x_last_error = 0
-        self.distance_integral = 0
-        self.distance_last_error = 0
-        self.last_update_time = time.time()
+        # Last print time of each rate-limited status line, by line name
+        self._last_print_ns: Dict[str, int] = {}
+        
+        # Last motor command sent, for the dead-band in set_motors
+        self._last_left = 0.0
+        self._last_right = 0.0
+        
+        # PID state: output and the last two errors per axis
+        self._reset_pid()
+        self._update_pid_coefficients()
+        
+        # Saved positions by marker ID, read once and kept in sync on save
+        self._positions = self._read_positions()
+        
+        # Latest (ids, centers, distances, frame_shape, frame_timestamp) from
+        # the detection thread
+        self._latest = None
+        self._lock = threading.Lock()
+        self._detection_changed = threading.Condition(self._lock)
+        self._detection_ready = threading.Event()
+        self._detect_stop = threading.Event()
+        self._detect_thread = None
+        
+        # Marker search_marker() is waiting for; the worker sets the event
+        # as soon as it is detected
+        self._search_id: Optional[int] = None
+        self._found_event = threading.Event()
         
         # Initialize hardware
         self._init_hardware()
         
     def _init_hardware(self):
         """Initialize hardware components."""
+        # Compile (or load the cached) PID step now rather than on the
+        # first control tick
+        self.calculate_control(0.0, 0.0)
+        self._reset_pid()
+        
         # Camera
         try:
             self.camera = CameraInterface()
             if self.camera.is_available():
                 self.camera.start()
-                self.detector = ArUcoDetector(marker_size_cm=10.0)
+                # Grab in the background so the control loop always reads
+                # the newest exposure instead of a queued one. Detection only
+                # needs luma, so convert on the capture thread
+                self.camera.start_async(gray=True)
+                # Frames are already resized to detection_width in _detect()
+                self.detector = ArUcoDetector(marker_size_cm=10.0, scale=1)
+                # Detect in a worker so slow frames never hold up motor updates
+                self._detect_thread = threading.Thread(
+                    target=self._detect_worker, name="aligner-detect", daemon=True)
+                self._detect_thread.start()
                 print("[OK] Camera initialized")
             else:
                 print("[ERROR] Camera not available")
@@ -141,22 +303,180 @@ class SimpleAligner:
         
         return True
     
+    @contextmanager
+    def _control_scheduling(self):
+        """Pin the calling (control) thread to its core and make it SCHED_FIFO.
+        
+        The previous affinity and policy are restored on exit, so threads
+        started afterwards and blocking prompts run at normal priority.
+        
+        Real-time priority needs root or CAP_SYS_NICE on the interpreter:
+            sudo setcap cap_sys_nice+ep "$(readlink -f "$(which python3)")"
+        Without it the loop keeps running at normal priority.
+        """
+        if not hasattr(os, 'sched_setaffinity'):
+            yield
+            return
+        
+        previous_affinity = None
+        cpu = self.config.control_cpu
+        if cpu >= 0:
+            try:
+                affinity = os.sched_getaffinity(0)
+                os.sched_setaffinity(0, {cpu})
+                previous_affinity = affinity
+            except OSError as e:
+                print(f"[WARN] Could not pin control loop to CPU {cpu}: {e}")
+        
+        previous_policy = None
+        priority = self.config.control_priority
+        if priority > 0:
+            try:
+                policy = (os.sched_getscheduler(0), os.sched_getparam(0))
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(priority))
+                previous_policy = policy
+            except PermissionError:
+                print("[WARN] No permission for real-time scheduling "
+                      "(needs CAP_SYS_NICE), using normal priority")
+            except OSError as e:
+                print(f"[WARN] Could not set real-time scheduling: {e}")
+        
+        try:
+            yield
+        finally:
+            try:
+                if previous_policy is not None:
+                    os.sched_setscheduler(0, *previous_policy)
+                if previous_affinity is not None:
+                    os.sched_setaffinity(0, previous_affinity)
+            except OSError as e:
+                print(f"[WARN] Could not restore scheduling: {e}")
+    
+    def _detect_worker(self):
+        """Detect markers on each new camera frame and publish the result."""
+        cpu = self.config.detect_cpu
+        if cpu >= 0 and hasattr(os, 'sched_setaffinity'):
+            try:
+                os.sched_setaffinity(0, {cpu})
+            except OSError as e:
+                print(f"[WARN] Could not pin detection to CPU {cpu}: {e}")
+        
+        last_timestamp = None
+        while not self._detect_stop.is_set():
+            try:
+                # Block until the capture thread publishes a newer frame
+                gray, timestamp = self.camera.wait_for_frame(last_timestamp, timeout=0.2)
+            except RuntimeError:
+                # Camera stalled; recheck the stop flag
+                continue
+            last_timestamp = timestamp
+            
+            ids, centers, distances = self._detect(gray)
+            with self._detection_changed:
+                self._latest = (ids, centers, distances, gray.shape, timestamp)
+                self._detection_changed.notify_all()
+            self._detection_ready.set()
+            
+            search_id = self._search_id
+            if search_id is not None and _index_of(ids, search_id) >= 0:
+                self._found_event.set()
+    
+    def _detect(self, gray: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Detect markers on a downscaled grayscale frame.
+        
+        Centers and distances are scaled back to full-frame pixels so
+        tolerances and target ratios keep their meaning.
+        
+        Returns:
+            Tuple of (ids, centers, distances) arrays
+        """
+        height, width = gray.shape
+        detection_width = self.config.detection_width
+        if not detection_width or width <= detection_width:
+            return self.detector.detect_marker_arrays(gray)
+        
+        scale = width / detection_width
+        small = cv2.resize(gray, (detection_width, round(height / scale)),
+                           interpolation=cv2.INTER_AREA)
+        ids, centers, distances = self.detector.detect_marker_arrays(small)
+        
+        return ids, centers * scale, distances / scale
+    
+    def latest_detection(self, timeout: float = 1.0) -> Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                              Tuple[int, ...], float]:
+        """Get the most recent detection result.
+        
+        Args:
+            timeout: Seconds to wait for the first result
+            
+        Returns:
+            Tuple of (ids, centers, distances, frame_shape, frame_timestamp)
+        """
+        if not self._detection_ready.wait(timeout):
+            raise RuntimeError("No detection result available")
+        with self._lock:
+            return self._latest
+    
+    def wait_for_detection(self, after: Optional[float],
+                           timeout: float = 0.2) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray,
+                                                                   Tuple[int, ...], float]]:
+        """Wait for a detection result from a frame newer than `after`.
+        
+        Args:
+            after: frame_timestamp of the last result the caller used, or
+                   None to take whatever is available
+            timeout: Seconds to wait for a new result
+            
+        Returns:
+            Tuple as for latest_detection(), or None if no newer frame was
+            detected in time
+        """
+        with self._detection_changed:
+            if not self._detection_changed.wait_for(
+                    lambda: self._latest is not None and self._latest[4] != after,
+                    timeout):
+                return None
+            return self._latest
+    
+    def _status_due(self, line: str) -> bool:
+        """Rate-limit an in-place status line to PRINT_PERIOD_NS.
+        
+        Each line is limited on its own, so one does not starve another.
+        """
+        now = time.monotonic_ns()
+        if now - self._last_print_ns.get(line, 0) < PRINT_PERIOD_NS:
+            return False
+        self._last_print_ns[line] = now
+        return True
+    
     def set_motors(self, left: float, right: float):
         """Set motor speeds with limits."""
-        # Apply limits
-        left = np.clip(left, -self.config.max_speed, self.config.max_speed)
-        right = np.clip(right, -self.config.max_speed, self.config.max_speed)
+        max_speed = self.config.max_speed
+        min_speed = self.config.min_speed
+        
+        # Apply limits (plain comparisons, these are scalars)
+        left = max(-max_speed, min(max_speed, left))
+        right = max(-max_speed, min(max_speed, right))
         
         # Apply minimum threshold
-        if 0 < abs(left) < self.config.min_speed:
-            left = self.config.min_speed * np.sign(left)
-        if 0 < abs(right) < self.config.min_speed:
-            right = self.config.min_speed * np.sign(right)
+        if 0 < abs(left) < min_speed:
+            left = min_speed if left > 0 else -min_speed
+        if 0 < abs(right) < min_speed:
+            right = min_speed if right > 0 else -min_speed
+        
+        # Skip near-identical commands while holding position; a full stop
+        # is always sent
+        if ((left or right) and
+                abs(left - self._last_left) < MOTOR_DEADBAND and
+                abs(right - self._last_right) < MOTOR_DEADBAND):
+            return
+        self._last_left = left
+        self._last_right = right
         
         if HARDWARE_AVAILABLE and self.left_motor and self.right_motor:
             self.left_motor.drive(left)
             self.right_motor.drive(right)
-        else:
+        elif self._status_due('motors'):
             # Simulation output
             print(f"Motors: L={left:+.1f}% R={right:+.1f}%", end='\r')
     
@@ -167,57 +487,51 @@ class SimpleAligner:
     def search_marker(self, marker_id: int, timeout: float = 10) -> bool:
         """Search for marker by rotating."""
         print(f"Searching for marker {marker_id}...")
-        start_time = time.time()
-        
-        while time.time() - start_time < timeout:
-            frame, _ = self.camera.capture_frame()
-            markers = self.detector.detect_markers(frame)
-            
-            if marker_id in markers:
-                print(f"Found marker {marker_id}")
-                self.stop()
-                return True
-            
-            # Rotate slowly
-            self.set_motors(-self.config.search_speed, self.config.search_speed)
-            time.sleep(0.05)
         
-        self.stop()
-        print(f"Marker {marker_id} not found")
-        return False
+        # Arm the worker before checking, so a detection landing in between
+        # still sets the event
+        self._search_id = marker_id
+        self._found_event.clear()
+        try:
+            ids = self.latest_detection()[0]
+            found = _index_of(ids, marker_id) >= 0
+            if not found:
+                # Rotate slowly until the worker reports the marker
+                self.set_motors(-self.config.search_speed, self.config.search_speed)
+                found = self._found_event.wait(timeout)
+        finally:
+            self._search_id = None
+            self.stop()
+        
+        if found:
+            print(f"Found marker {marker_id}")
+        else:
+            print(f"Marker {marker_id} not found")
+        return found
     
-    def calculate_control(self, x_error: float, distance_error: float, dt: float) -> Tuple[float, float]:
-        """Calculate PID control for motors."""
-        # X-axis PID
-        self.x_integral += x_error * dt
-        self.x_integral = np.clip(self.x_integral, -100, 100)  # Anti-windup
-        
-        x_derivative = (x_error - self.x_last_error) / dt if dt > 0 else 0
-        self.x_last_error = x_error
-        
-        x_control = (
-            self.config.kp_x * x_error +
-            self.config.ki_x * self.x_integral +
-            self.config.kd_x * x_derivative
-        )
-        
-        # Distance PID
-        self.distance_integral += distance_error * dt
-        self.distance_integral = np.clip(self.distance_integral, -100, 100)
-        
-        distance_derivative = (distance_error - self.distance_last_error) / dt if dt > 0 else 0
-        self.distance_last_error = distance_error
-        
-        distance_control = (
-            self.config.kp_distance * distance_error +
-            self.config.ki_distance * self.distance_integral +
-            self.config.kd_distance * distance_derivative
-        )
-        
-        # Combine controls
-        left = distance_control - x_control
-        right = distance_control + x_control
-        
+    def _reset_pid(self):
+        """Clear PID outputs and error history."""
+        self._pid_state = np.zeros(PID_STATE_SIZE)
+    
+    def _update_pid_coefficients(self):
+        """Pack the gains for the compiled control step.
+        
+        Called at the start of each alignment so gains changed in --tune
+        mode take effect.
+        """
+        cfg = self.config
+        self._pid_coeffs = np.array([
+            cfg.kp_x, cfg.ki_x, cfg.kd_x,
+            cfg.kp_distance, cfg.ki_distance, cfg.kd_distance,
+            cfg.max_speed, cfg.error_filter_alpha
+        ], dtype=np.float64)
+    
+    def calculate_control(self, x_error: float, distance_error: float,
+                          dt: float = DEFAULT_CONTROL_DT) -> Tuple[float, float]:
+        """Calculate PID control for motors, dt seconds after the last call."""
+        # With a zero measurement the targets are the errors themselves
+        left, right, _, _, _ = _align_step(0.0, 0.0, x_error, distance_error, 0.0, 0.0,
+                                           dt, self._pid_state, self._pid_coeffs)
         return left, right
     
     def align_with_marker(self, marker_id: int, verbose: bool = True) -> bool:
@@ -226,12 +540,15 @@ class SimpleAligner:
             print("[ERROR] Camera not initialized")
             return False
         
+        # Real-time scheduling only for the duration of the control loop
+        with self._control_scheduling():
+            return self._align(marker_id, verbose)
+    
+    def _align(self, marker_id: int, verbose: bool) -> bool:
+        """Search for the marker and run the control loop until aligned."""
         # Reset PID state
-        self.x_integral = 0
-        self.x_last_error = 0
-        self.distance_integral = 0
-        self.distance_last_error = 0
-        self.last_update_time = time.time()
+        self._reset_pid()
+        self._update_pid_coefficients()
         
         # Search for marker
         if not self.search_marker(marker_id):
@@ -240,91 +557,130 @@ class SimpleAligner:
         print(f"Aligning with marker {marker_id}")
         print(f"Target: {self.config.target_distance_cm}cm, X={self.config.target_x_ratio:.2f}")
         
-        start_time = time.time()
+        # Loop invariants: the resolution and config do not change mid-alignment
+        cfg = self.config
+        frame_width, _ = self.camera.get_actual_resolution()
+        target_x = cfg.target_x_ratio * frame_width
+        # Plain floats so the compiled step is specialized only once
+        target_distance = float(cfg.target_distance_cm)
+        tolerance_x = float(cfg.tolerance_x_pixels)
+        tolerance_distance = float(cfg.tolerance_distance_cm)
+        pid_state = self._pid_state
+        pid_coeffs = self._pid_coeffs
+        required_stable = cfg.required_stable_frames
+        fps = self.camera.get_fps()
+        first_dt = 1.0 / fps if fps > 0 else DEFAULT_CONTROL_DT
+        
+        deadline = time.monotonic_ns() + int(cfg.max_alignment_time * 1e9)
         stable_count = 0
-        
-        while time.time() - start_time < self.config.max_alignment_time:
-            # Capture and detect
-            frame, _ = self.camera.capture_frame()
-            markers = self.detector.detect_markers(frame)
+        last_timestamp = None
+        # Frame time of the last PID step, None until the marker is tracked
+        step_timestamp = None
+        
+        # Frame-paced: one control step per detected camera frame
+        while time.monotonic_ns() < deadline:
+            latest = self.wait_for_detection(last_timestamp)
+            if latest is None:
+                # Camera stalled, keep the current command
+                continue
+            ids, centers, distances, _, timestamp = latest
+            last_timestamp = timestamp
             
-            if marker_id not in markers:
+            i = _index_of(ids, marker_id)
+            if i < 0:
                 print("Lost marker, searching...")
                 if not self.search_marker(marker_id, timeout=5):
                     return False
+                # Re-seed the error filter and history from the re-acquired
+                # marker
+                pid_state[FILTER_PRIMED] = 0.0
+                step_timestamp = None
                 continue
             
-            marker = markers[marker_id]
-            frame_height, frame_width = frame.shape[:2]
+            # The PID runs once per frame, so its period is the measured
+            # time between the frames it was given
+            if step_timestamp is None:
+                dt = first_dt
+            else:
+                dt = min(timestamp - step_timestamp, MAX_CONTROL_DT)
+                if dt <= 0.0:
+                    dt = first_dt
+            step_timestamp = timestamp
             
-            # Calculate errors
-            target_x = self.config.target_x_ratio * frame_width
-            x_error = target_x - marker.center[0]
-            distance_error = self.config.target_distance_cm - marker.distance
+            # Errors, alignment check and PID in one compiled step
+            left, right, x_error, distance_error, aligned = _align_step(
+                float(centers[i, 0]), float(distances[i]),
+                target_x, target_distance, tolerance_x, tolerance_distance,
+                dt, pid_state, pid_coeffs
+            )
             
-            # Check if aligned
-            if (abs(x_error) <= self.config.tolerance_x_pixels and
-                abs(distance_error) <= self.config.tolerance_distance_cm):
+            if aligned:
                 stable_count += 1
                 if verbose:
-                    print(f"Aligned! Holding... ({stable_count}/{self.config.required_stable_frames})")
+                    print(f"Aligned! Holding... ({stable_count}/{required_stable})")
                 
-                if stable_count >= self.config.required_stable_frames:
+                if stable_count >= required_stable:
                     self.stop()
                     print("[SUCCESS] Alignment complete!")
                     return True
             else:
                 stable_count = 0
             
-            # Calculate control
-            current_time = time.time()
-            dt = current_time - self.last_update_time
-            self.last_update_time = current_time
-            
-            left, right = self.calculate_control(x_error, distance_error, dt)
             self.set_motors(left, right)
             
-            if verbose:
+            if verbose and self._status_due('errors'):
                 print(f"X err: {x_error:+.0f}px, Dist err: {distance_error:+.1f}cm, "
                       f"Motors: L={left:+.0f}% R={right:+.0f}%", end='\r')
-            
-            time.sleep(0.05)  # 20Hz control loop
         
         self.stop()
         print("[TIMEOUT] Alignment timeout")
         return False
     
+    @staticmethod
+    def _read_positions() -> Dict[str, Dict]:
+        """Read saved positions, legacy JSON first, then the JSONL log."""
+        positions = {}
+        
+        try:
+            with open(LEGACY_POSITIONS_FILE, 'r') as f:
+                positions.update(json.load(f))
+        except FileNotFoundError:
+            pass
+        
+        try:
+            with open(POSITIONS_FILE, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        position = json.loads(line)
+                        positions[str(position['marker_id'])] = position
+        except FileNotFoundError:
+            pass
+        
+        return positions
+    
     def save_position(self, marker_id: int, name: str = None) -> bool:
         """Save current position relative to visible marker."""
-        frame, _ = self.camera.capture_frame()
-        markers = self.detector.detect_markers(frame)
+        ids, centers, distances, frame_shape, _ = self.latest_detection()
         
-        if marker_id not in markers:
+        i = _index_of(ids, marker_id)
+        if i < 0:
             print(f"Marker {marker_id} not visible")
             return False
         
-        marker = markers[marker_id]
-        frame_height, frame_width = frame.shape[:2]
+        frame_height, frame_width = frame_shape[:2]
         
         position = {
             'marker_id': marker_id,
             'name': name or f"Position_{marker_id}",
-            'x_ratio': marker.center[0] / frame_width,
-            'distance_cm': marker.distance,
+            'x_ratio': float(centers[i, 0] / frame_width),
+            'distance_cm': float(distances[i]),
             'timestamp': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        # Load existing positions
-        positions_file = 'saved_positions.json'
-        positions = {}
-        if os.path.exists(positions_file):
-            with open(positions_file, 'r') as f:
-                positions = json.load(f)
-        
-        positions[str(marker_id)] = position
-        
-        with open(positions_file, 'w') as f:
-            json.dump(positions, f, indent=2)
+        # Append only, no need to rewrite the other positions
+        with open(POSITIONS_FILE, 'a') as f:
+            f.write(json.dumps(position) + '\n')
+        self._positions[str(marker_id)] = position
         
         print(f"Saved position for marker {marker_id}")
         print(f"  X ratio: {position['x_ratio']:.3f}")
@@ -334,20 +690,15 @@ class SimpleAligner:
     
     def load_position(self, marker_id: int) -> bool:
         """Load saved position for marker."""
-        positions_file = 'saved_positions.json'
-        
-        if not os.path.exists(positions_file):
+        if not self._positions:
             print("No saved positions found")
             return False
         
-        with open(positions_file, 'r') as f:
-            positions = json.load(f)
-        
-        if str(marker_id) not in positions:
+        pos = self._positions.get(str(marker_id))
+        if pos is None:
             print(f"No saved position for marker {marker_id}")
             return False
         
-        pos = positions[str(marker_id)]
         self.config.target_x_ratio = pos['x_ratio']
         self.config.target_distance_cm = pos['distance_cm']
         
@@ -361,6 +712,11 @@ class SimpleAligner:
         """Clean up resources."""
         self.stop()
         
+        if self._detect_thread:
+            self._detect_stop.set()
+            self._detect_thread.join(timeout=1.0)
+            self._detect_thread = None
+        
         if self.camera:
             self.camera.stop()
         
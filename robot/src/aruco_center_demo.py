@@ -3,18 +3,27 @@
 
 import cv2
 import numpy as np
+import os
 import time
 import logging
 import threading
 import signal
 import sys
-from typing import Optional, Tuple, Dict, Any
-from dataclasses import dataclass
+from typing import Optional, Tuple
 from queue import Queue
 import tkinter as tk
 from tkinter import ttk
 from PIL import Image, ImageTk
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the controller step runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 try:
     from gpiozero import Device
     from gpiozero.pins.lgpio import LGPIOFactory
@@ -25,6 +34,9 @@ except ImportError:
     print("Warning: gpiozero not available, running in simulation mode")
 
 from .camera import CameraInterface
+# Re-exported: the detector used to live here and callers import it from
+# this module
+from .aruco_detector import MarkerInfo, MarkerBatch, ArUcoDetector
 if HARDWARE_AVAILABLE:
     from .pins import (
         LEFT_MOTOR_R_EN, LEFT_MOTOR_L_EN, LEFT_MOTOR_RPWM, LEFT_MOTOR_LPWM,
@@ -36,18 +48,44 @@ if HARDWARE_AVAILABLE:
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
-@dataclass
-class MarkerInfo:
-    """Information about detected ArUco marker."""
-    id: int
-    center: Tuple[float, float]
-    corners: np.ndarray
-    size: float
-    distance: float  # Estimated distance based on marker size
+@njit(cache=True)
+def _centering_step(heading_error, distance_error, heading_integral, distance_integral,
+                    kp_heading, ki_heading, kp_distance, ki_distance,
+                    heading_deadband, distance_deadband, max_speed, min_speed):
+    """One CenteringController update, returning (left, right, integrals...)."""
+    # Update and clamp integral terms (dt ~ 0.1s)
+    heading_integral = max(-100.0, min(100.0, heading_integral + heading_error * 0.1))
+    distance_integral = max(-50.0, min(50.0, distance_integral + distance_error * 0.1))
+    
+    # Apply deadband
+    if abs(heading_error) < heading_deadband:
+        heading_error = 0.0
+        heading_integral *= 0.9  # Decay integral
+    
+    if abs(distance_error) < distance_deadband:
+        distance_error = 0.0
+        distance_integral *= 0.9  # Decay integral
+    
+    # Calculate control signals and convert to motor speeds
+    turn_control = kp_heading * heading_error + ki_heading * heading_integral
+    forward_control = kp_distance * distance_error + ki_distance * distance_integral
+    left_speed = max(-max_speed, min(max_speed, forward_control + turn_control))
+    right_speed = max(-max_speed, min(max_speed, forward_control - turn_control))
+    
+    # Apply minimum speed threshold
+    if abs(left_speed) < min_speed and left_speed != 0:
+        left_speed = min_speed if left_speed > 0 else -min_speed
+    if abs(right_speed) < min_speed and right_speed != 0:
+        right_speed = min_speed if right_speed > 0 else -min_speed
+    
+    return left_speed, right_speed, heading_integral, distance_integral
 
 class MotorController:
     """Motor control for centering behavior."""
     
+    # Speed changes smaller than this (percent) are not sent to the motors
+    SPEED_DEADBAND = 1.0
+    
     def __init__(self, simulation_mode: bool = False):
         """Initialize motor controller."""
         self.simulation_mode = simulation_mode or not HARDWARE_AVAILABLE
@@ -55,6 +93,8 @@ class MotorController:
         self.right_motor = None
         self.current_left_speed = 0
         self.current_right_speed = 0
+        self._drive_left = None
+        self._drive_right = None
         
         if not self.simulation_mode:
             self._init_motors()
@@ -82,20 +122,37 @@ class MotorController:
             
             self.left_motor.enable()
             self.right_motor.enable()
+            
+            # Bound methods for the per-frame set_speeds() path
+            self._drive_left = self.left_motor.drive
+            self._drive_right = self.right_motor.drive
             logger.info("Motors initialized")
         except Exception as e:
             logger.error(f"Failed to initialize motors: {e}")
             self.simulation_mode = True
     
     def set_speeds(self, left_speed: float, right_speed: float):
-        """Set motor speeds."""
+        """Set motor speeds.
+        
+        Changes under SPEED_DEADBAND are skipped, except a stop, which is
+        always sent.
+        """
+        current_left = self.current_left_speed
+        current_right = self.current_right_speed
+        stopping = ((left_speed == 0 and current_left != 0) or
+                    (right_speed == 0 and current_right != 0))
+        if (not stopping and
+                abs(left_speed - current_left) < self.SPEED_DEADBAND and
+                abs(right_speed - current_right) < self.SPEED_DEADBAND):
+            return
+        
         self.current_left_speed = left_speed
         self.current_right_speed = right_speed
         
         if not self.simulation_mode:
             try:
-                self.left_motor.drive(left_speed)
-                self.right_motor.drive(right_speed)
+                self._drive_left(left_speed)
+                self._drive_right(right_speed)
             except Exception as e:
                 logger.error(f"Error setting motor speeds: {e}")
     
@@ -117,102 +174,6 @@ class MotorController:
             except Exception as e:
                 logger.error(f"Error during motor cleanup: {e}")
 
-class ArUcoDetector:
-    """ArUco marker detection and tracking."""
-    
-    def __init__(self, marker_size_cm: float = 10.0):
-        """Initialize ArUco detector.
-        
-        Args:
-            marker_size_cm: Real-world marker size in centimeters
-        """
-        self.marker_size_cm = marker_size_cm
-        
-        # Use 4x4 ArUco dictionary (smaller markers, easier to print)
-        self.aruco_dict = cv2.aruco.Dictionary_get(cv2.aruco.DICT_4X4_50)
-        self.aruco_params = cv2.aruco.DetectorParameters_create()
-        
-        # Camera calibration for Innomaker 1080P 130° wide angle camera
-        # Wide angle lens has shorter focal length
-        # For 130° FOV at 1920x1080:
-        # focal_length_pixels ≈ (image_width / 2) / tan(FOV/2)
-        # focal_length_pixels ≈ (1920 / 2) / tan(65°) ≈ 448 pixels
-        # Adjusted for 640x480 capture: 448 * (640/1920) ≈ 149 pixels
-        self.camera_matrix = np.array([
-            [149, 0, 320],  # Focal length and principal point x
-            [0, 149, 240],  # Focal length and principal point y
-            [0, 0, 1]
-        ], dtype=float)
-        
-        # Wide angle lens typically has barrel distortion
-        # These are approximate values for a 130° lens
-        self.dist_coeffs = np.array([-0.3, 0.1, 0, 0, 0], dtype=float)
-    
-    def detect_markers(self, frame: np.ndarray) -> Dict[int, MarkerInfo]:
-        """Detect ArUco markers in frame.
-        
-        Returns:
-            Dictionary of marker ID to MarkerInfo
-        """
-        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
-        corners, ids, _ = cv2.aruco.detectMarkers(
-            gray, self.aruco_dict, parameters=self.aruco_params
-        )
-        
-        markers = {}
-        if ids is not None:
-            for i, marker_id in enumerate(ids.flatten()):
-                marker_corners = corners[i][0]
-                
-                # Calculate center
-                center_x = np.mean(marker_corners[:, 0])
-                center_y = np.mean(marker_corners[:, 1])
-                
-                # Calculate size (average of width and height)
-                width = np.linalg.norm(marker_corners[0] - marker_corners[1])
-                height = np.linalg.norm(marker_corners[1] - marker_corners[2])
-                size = (width + height) / 2
-                
-                # Estimate distance using calibrated focal length
-                # Using the calibrated focal length from camera matrix
-                focal_length = self.camera_matrix[0, 0]  # 149 pixels for wide angle
-                distance = (self.marker_size_cm * focal_length) / size
-                
-                markers[marker_id] = MarkerInfo(
-                    id=marker_id,
-                    center=(center_x, center_y),
-                    corners=marker_corners,
-                    size=size,
-                    distance=distance
-                )
-        
-        return markers
-    
-    def draw_markers(self, frame: np.ndarray, markers: Dict[int, MarkerInfo]) -> np.ndarray:
-        """Draw detected markers on frame."""
-        annotated = frame.copy()
-        
-        for marker_id, info in markers.items():
-            # Draw marker outline
-            corners_int = info.corners.astype(int)
-            cv2.polylines(annotated, [corners_int], True, (0, 255, 0), 2)
-            
-            # Draw center
-            center_int = tuple(map(int, info.center))
-            cv2.circle(annotated, center_int, 5, (0, 0, 255), -1)
-            
-            # Draw ID and distance
-            text = f"ID:{marker_id} D:{info.distance:.1f}cm"
-            cv2.putText(annotated, text, 
-                       (corners_int[0][0], corners_int[0][1] - 10),
-                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
-        
-        # Draw center line
-        h, w = frame.shape[:2]
-        cv2.line(annotated, (w//2, 0), (w//2, h), (255, 0, 0), 1)
-        
-        return annotated
-
 class CenteringController:
     """PID-based centering controller."""
     
@@ -231,8 +192,8 @@ class CenteringController:
         self.ki_distance = 0.05  # Integral gain for distance
         
         # Integral terms
-        self.heading_integral = 0
-        self.distance_integral = 0
+        self.heading_integral = 0.0
+        self.distance_integral = 0.0
         
         # Deadband thresholds
         self.heading_deadband = 20  # pixels
@@ -241,6 +202,10 @@ class CenteringController:
         # Speed limits
         self.max_speed = 40
         self.min_speed = 15
+        
+        # Image center, recomputed only when the frame width changes
+        self._frame_w = 0
+        self._center_x = 0.0
     
     def compute_control(self, marker: MarkerInfo, frame_width: int) -> Tuple[float, float]:
         """Compute motor speeds to center on marker.
@@ -251,54 +216,37 @@ class CenteringController:
         if marker is None:
             return 0, 0
         
-        # Calculate errors
-        center_x = frame_width / 2
-        heading_error = marker.center[0] - center_x
-        distance_error = self.target_distance - marker.distance
-        
-        # Update integral terms
-        self.heading_integral += heading_error * 0.1  # dt ~ 0.1s
-        self.distance_integral += distance_error * 0.1
-        
-        # Clamp integral terms
-        self.heading_integral = np.clip(self.heading_integral, -100, 100)
-        self.distance_integral = np.clip(self.distance_integral, -50, 50)
-        
-        # Apply deadband
-        if abs(heading_error) < self.heading_deadband:
-            heading_error = 0
-            self.heading_integral *= 0.9  # Decay integral
-        
-        if abs(distance_error) < self.distance_deadband:
-            distance_error = 0
-            self.distance_integral *= 0.9  # Decay integral
-        
-        # Calculate control signals
-        turn_control = (self.kp_heading * heading_error + 
-                       self.ki_heading * self.heading_integral)
-        
-        forward_control = (self.kp_distance * distance_error + 
-                          self.ki_distance * self.distance_integral)
-        
-        # Convert to motor speeds
-        left_speed = forward_control + turn_control
-        right_speed = forward_control - turn_control
-        
-        # Clamp speeds
-        left_speed = np.clip(left_speed, -self.max_speed, self.max_speed)
-        right_speed = np.clip(right_speed, -self.max_speed, self.max_speed)
-        
-        # Apply minimum speed threshold
-        if abs(left_speed) < self.min_speed and left_speed != 0:
-            left_speed = self.min_speed if left_speed > 0 else -self.min_speed
-        if abs(right_speed) < self.min_speed and right_speed != 0:
-            right_speed = self.min_speed if right_speed > 0 else -self.min_speed
+        if frame_width != self._frame_w:
+            self._frame_w = frame_width
+            self._center_x = frame_width * 0.5
+        
+        # Calculate errors (as Python floats, scalar NumPy math is slow)
+        heading_error = float(marker.center[0]) - self._center_x
+        distance_error = self.target_distance - float(marker.distance)
+        
+        # Gains are read every call so they stay tunable at runtime
+        left_speed, right_speed, self.heading_integral, self.distance_integral = _centering_step(
+            heading_error, distance_error,
+            float(self.heading_integral), float(self.distance_integral),
+            float(self.kp_heading), float(self.ki_heading),
+            float(self.kp_distance), float(self.ki_distance),
+            float(self.heading_deadband), float(self.distance_deadband),
+            float(self.max_speed), float(self.min_speed)
+        )
         
         return left_speed, right_speed
 
 class ArUcoCenterGUI:
     """GUI for ArUco centering demonstration."""
     
+    # Tracking ROI padding around the target, in marker sizes
+    ROI_MARGIN = 1.5
+    
+    # The marker fills most of a tracking crop: its perimeter is about
+    # 4 / (1 + 2 * ROI_MARGIN) times the crop side, and more once the crop
+    # is clipped at the frame edge
+    ROI_MAX_PERIMETER_RATE = 4.0
+    
     def __init__(self, root: tk.Tk):
         """Initialize GUI."""
         self.root = root
@@ -308,6 +256,8 @@ class ArUcoCenterGUI:
         # Components
         self.camera = None
         self.detector = ArUcoDetector(marker_size_cm=10.0)  # 100mm = 10cm markers
+        self.roi_detector = ArUcoDetector(marker_size_cm=10.0,
+                                          max_perimeter_rate=self.ROI_MAX_PERIMETER_RATE)
         self.controller = CenteringController()
         self.motors = MotorController()
         
@@ -316,7 +266,27 @@ class ArUcoCenterGUI:
         self.tracking_enabled = False
         self.target_marker_id = None
         self.current_frame = None
-        self.frame_queue = Queue(maxsize=2)
+        self.frame_queue = Queue(maxsize=1)  # One display-ready frame for the GUI
+        
+        # Newest camera frame, written by the capture thread
+        self._latest_frame = None
+        self._latest_lock = threading.Lock()
+        self._frame_ready = threading.Event()
+        
+        # Crop (x, y, w, h) around the tracked marker, None for full frame
+        self._last_bbox = None
+        
+        # Last (text, color) per status label and last shown speeds, so Tk
+        # widgets are only reconfigured when something changed
+        self._last_status = {}
+        self._last_speeds = None
+        
+        # Annotate and prepare display frames through OpenCL when available;
+        # BEVBOT_OPENCL=0 forces the plain NumPy path for comparison
+        self.use_opencl = (cv2.ocl.haveOpenCL() and
+                           os.environ.get('BEVBOT_OPENCL', '1') != '0')
+        cv2.ocl.setUseOpenCL(self.use_opencl)
+        logger.info(f"OpenCL display path: {'on' if self.use_opencl else 'off'}")
         
         # Setup GUI
         self._setup_gui()
@@ -324,7 +294,9 @@ class ArUcoCenterGUI:
         # Start camera
         self._init_camera()
         
-        # Start processing thread
+        # Start capture and processing threads
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
         self.processing_thread = threading.Thread(target=self._processing_loop, daemon=True)
         self.processing_thread.start()
         
@@ -341,6 +313,10 @@ class ArUcoCenterGUI:
         self.video_label = ttk.Label(main_frame)
         self.video_label.grid(row=0, column=0, columnspan=2, pady=5)
         
+        # One display image for the whole session; frames are pasted into it
+        self._photo = ImageTk.PhotoImage(Image.new('RGB', (640, 480)))
+        self.video_label.config(image=self._photo)
+        
         # Control panel
         control_frame = ttk.LabelFrame(main_frame, text="Controls", padding="10")
         control_frame.grid(row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=10)
@@ -422,26 +398,79 @@ class ArUcoCenterGUI:
             self.status_labels["camera_status"].config(text="Error", foreground="red")
             logger.error(f"Failed to initialize camera: {e}")
     
+    def _capture_loop(self):
+        """Keep only the newest camera frame (runs in separate thread)."""
+        while self.running and self.camera:
+            try:
+                frame, _ = self.camera.capture_frame()
+            except Exception as e:
+                logger.error(f"Capture error: {e}")
+                time.sleep(0.1)
+                continue
+            
+            with self._latest_lock:
+                self._latest_frame = frame
+            self._frame_ready.set()
+    
+    def _detect_tracked(self, frame: np.ndarray) -> MarkerBatch:
+        """Detect markers, searching only around the target while tracking.
+        
+        Falls back to the full frame when the crop comes up empty. Returned
+        centers and corners are always in full-frame coordinates.
+        """
+        if self.tracking_enabled and self._last_bbox is not None:
+            x, y, w, h = self._last_bbox
+            batch = self.roi_detector.detect_marker_batch(frame[y:y + h, x:x + w])
+            if len(batch):
+                batch.centers += (x, y)
+                batch.corners += (x, y)
+                return batch
+        
+        return self.detector.detect_marker_batch(frame)
+    
+    def _update_roi(self, target_marker: Optional[MarkerInfo], frame: np.ndarray):
+        """Set the next frame's search crop from the target's bounding box."""
+        if target_marker is None:
+            self._last_bbox = None
+            return
+        
+        frame_h, frame_w = frame.shape[:2]
+        margin = self.ROI_MARGIN * target_marker.size
+        x0, y0 = target_marker.corners.min(axis=0) - margin
+        x1, y1 = target_marker.corners.max(axis=0) + margin
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(frame_w, int(x1) + 1), min(frame_h, int(y1) + 1)
+        self._last_bbox = (x0, y0, x1 - x0, y1 - y0)
+    
     def _processing_loop(self):
         """Main processing loop (runs in separate thread)."""
-        while True:
-            if self.running and self.camera:
+        while self.running:
+            # One pass per new frame; the timeout only bounds how long a
+            # stalled camera keeps the loop from rechecking self.running
+            if not self._frame_ready.wait(timeout=0.2):
+                continue
+            self._frame_ready.clear()
+            
+            with self._latest_lock:
+                frame = self._latest_frame
+            
+            if self.running and frame is not None:
                 try:
-                    # Capture frame
-                    frame, _ = self.camera.capture_frame()
-                    
                     # Detect markers
-                    markers = self.detector.detect_markers(frame)
+                    batch = self._detect_tracked(frame)
                     
-                    # Select target marker
+                    # Select target marker; only it becomes a MarkerInfo
                     target_marker = None
-                    if markers:
+                    if len(batch):
                         if self.target_marker_id is None:
-                            # Use closest marker
-                            target_marker = min(markers.values(), 
-                                              key=lambda m: m.distance)
-                        elif self.target_marker_id in markers:
-                            target_marker = markers[self.target_marker_id]
+                            # Use closest marker: distance falls as size
+                            # grows, so the largest marker is the closest
+                            k = int(batch.sizes.argmax())
+                        else:
+                            k = batch.index_of(self.target_marker_id)
+                        if k >= 0:
+                            target_marker = batch.marker(k)
+                    self._update_roi(target_marker, frame)
                     
                     # Compute control
                     if self.tracking_enabled and target_marker:
@@ -452,80 +481,76 @@ class ArUcoCenterGUI:
                     else:
                         self.motors.stop()
                     
-                    # Annotate frame
-                    annotated_frame = self.detector.draw_markers(frame, markers)
-                    
-                    # Add tracking indicator
-                    if self.tracking_enabled and target_marker:
-                        cv2.putText(annotated_frame, "TRACKING", (10, 30),
-                                  cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
-                    
-                    # Queue frame for display
-                    if not self.frame_queue.full():
-                        self.frame_queue.put((annotated_frame, markers, target_marker))
+                    # Only annotate when the GUI has taken the last frame;
+                    # drawing a frame that would be dropped is wasted work
+                    if self.frame_queue.empty():
+                        annotated_frame = self.detector.draw_marker_batch(
+                            frame, batch, umat=self.use_opencl)
+                        
+                        # Add tracking indicator
+                        if self.tracking_enabled and target_marker:
+                            cv2.putText(annotated_frame, "TRACKING", (10, 30),
+                                      cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+                        
+                        # Prepare the display image here, off the Tk thread
+                        display_frame = cv2.resize(
+                            cv2.cvtColor(annotated_frame, cv2.COLOR_BGR2RGB), (640, 480)
+                        )
+                        if self.use_opencl:
+                            display_frame = display_frame.get()
+                        self.frame_queue.put_nowait((display_frame, batch, target_marker))
                     
                 except Exception as e:
                     logger.error(f"Processing error: {e}")
-            
-            time.sleep(0.05)  # ~20 FPS
+    
+    def _set_status(self, key: str, text: str, color: str):
+        """Update a status label, skipping the Tk call when nothing changed."""
+        value = (text, color)
+        if self._last_status.get(key) != value:
+            self.status_labels[key].config(text=text, foreground=color)
+            self._last_status[key] = value
     
     def _update_gui(self):
         """Update GUI with latest frame and status."""
         try:
             if not self.frame_queue.empty():
-                frame, markers, target_marker = self.frame_queue.get_nowait()
-                
-                # Convert frame to PhotoImage
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frame_resized = cv2.resize(frame_rgb, (640, 480))
-                img = Image.fromarray(frame_resized)
-                photo = ImageTk.PhotoImage(image=img)
+                frame, batch, target_marker = self.frame_queue.get_nowait()
                 
-                # Update video display
-                self.video_label.config(image=photo)
-                self.video_label.image = photo  # Keep reference
+                # Frame is already 640x480 RGB; paste it into the existing PhotoImage
+                img = Image.frombuffer('RGB', (640, 480), frame, 'raw', 'RGB', 0, 1)
+                self._photo.paste(img)
                 
                 # Update status
                 if target_marker:
-                    self.status_labels["marker_status"].config(
-                        text=f"ID {target_marker.id}", foreground="green"
-                    )
-                    self.status_labels["distance_status"].config(
-                        text=f"{target_marker.distance:.1f} cm", foreground="blue"
-                    )
+                    self._set_status("marker_status", f"ID {target_marker.id}", "green")
+                    self._set_status("distance_status",
+                                     f"{target_marker.distance:.1f} cm", "blue")
                 else:
-                    self.status_labels["marker_status"].config(
-                        text="Not found", foreground="orange"
-                    )
-                    self.status_labels["distance_status"].config(
-                        text="--", foreground="gray"
-                    )
+                    self._set_status("marker_status", "Not found", "orange")
+                    self._set_status("distance_status", "--", "gray")
                 
                 # Update motor status
                 if self.tracking_enabled:
-                    self.status_labels["motor_status"].config(
-                        text="Active", foreground="green"
-                    )
+                    self._set_status("motor_status", "Active", "green")
                 else:
-                    self.status_labels["motor_status"].config(
-                        text="Stopped", foreground="gray"
-                    )
+                    self._set_status("motor_status", "Stopped", "gray")
                 
                 # Update mode
                 if self.motors.simulation_mode:
-                    self.status_labels["mode_status"].config(
-                        text="Simulation", foreground="orange"
-                    )
+                    self._set_status("mode_status", "Simulation", "orange")
                 else:
-                    self.status_labels["mode_status"].config(
-                        text="Hardware", foreground="green"
-                    )
+                    self._set_status("mode_status", "Hardware", "green")
                 
-                # Update speed displays
-                self.left_speed_var.set(abs(self.motors.current_left_speed))
-                self.right_speed_var.set(abs(self.motors.current_right_speed))
-                self.left_speed_label.config(text=f"{self.motors.current_left_speed:.0f}%")
-                self.right_speed_label.config(text=f"{self.motors.current_right_speed:.0f}%")
+                # Update speed displays (whole percent, only when changed)
+                speeds = (round(self.motors.current_left_speed),
+                          round(self.motors.current_right_speed))
+                if speeds != self._last_speeds:
+                    self._last_speeds = speeds
+                    left, right = speeds
+                    self.left_speed_var.set(abs(left))
+                    self.right_speed_var.set(abs(right))
+                    self.left_speed_label.config(text=f"{left}%")
+                    self.right_speed_label.config(text=f"{right}%")
         
         except Exception as e:
             logger.debug(f"GUI update error: {e}")
@@ -565,6 +590,13 @@ class ArUcoCenterGUI:
         logger.info("Shutting down...")
         self.running = False
         self.tracking_enabled = False
+        
+        # Wake the processing thread so it sees running=False, and let both
+        # threads finish before the motors and camera go away
+        self._frame_ready.set()
+        self.processing_thread.join(timeout=1.0)
+        self.capture_thread.join(timeout=1.0)
+        
         self.motors.cleanup()
         if self.camera:
             self.camera.stop()
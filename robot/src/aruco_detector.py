@@ -0,0 +1,505 @@
+"""ArUco marker detection for BevBot.
+
+Kept free of GUI and GPIO imports so detection worker processes can load
+it without touching tkinter or the gpiozero pin factory.
+"""
+
+import cv2
+import numpy as np
+import math
+import os
+import logging
+from typing import Optional, Tuple, Dict, Set
+from dataclasses import dataclass
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    # Numba is optional; without it the kernels below run as NumPy/Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+logger = logging.getLogger(__name__)
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _corner_geometry(quads, marker_size_cm, focal_length):
+        """Centers, sizes and distances for (N, 4, 2) marker corners."""
+        n = quads.shape[0]
+        centers = np.empty((n, 2), dtype=np.float32)
+        sizes = np.empty(n, dtype=np.float64)
+        distances = np.empty(n, dtype=np.float64)
+        for i in range(n):
+            cx = 0.0
+            cy = 0.0
+            for j in range(4):
+                cx += quads[i, j, 0]
+                cy += quads[i, j, 1]
+            centers[i, 0] = cx * 0.25
+            centers[i, 1] = cy * 0.25
+            
+            # Size is the average of width (corner 0-1) and height (corner 1-2)
+            width = math.sqrt((quads[i, 1, 0] - quads[i, 0, 0]) ** 2 +
+                              (quads[i, 1, 1] - quads[i, 0, 1]) ** 2)
+            height = math.sqrt((quads[i, 2, 0] - quads[i, 1, 0]) ** 2 +
+                               (quads[i, 2, 1] - quads[i, 1, 1]) ** 2)
+            size = 0.5 * (width + height)
+            sizes[i] = size
+            distances[i] = marker_size_cm * focal_length / size
+        return centers, sizes, distances
+
+@dataclass
+class MarkerInfo:
+    """Information about detected ArUco marker."""
+    id: int
+    center: Tuple[float, float]
+    corners: np.ndarray
+    size: float
+    distance: float  # Estimated distance based on marker size
+
+@dataclass
+class MarkerBatch:
+    """All markers detected in one frame, one array row per marker."""
+    ids: np.ndarray        # (N,)
+    corners: np.ndarray    # (N, 4, 2) float32
+    centers: np.ndarray    # (N, 2)
+    sizes: np.ndarray      # (N,)
+    distances: np.ndarray  # (N,) estimated distance in cm
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def index_of(self, marker_id: int) -> int:
+        """Row of marker_id in the batch, or -1 if it was not detected."""
+        rows = np.flatnonzero(self.ids == marker_id)
+        return int(rows[0]) if len(rows) else -1
+    
+    def marker(self, k: int) -> MarkerInfo:
+        """Build a MarkerInfo for row k."""
+        return MarkerInfo(
+            id=int(self.ids[k]),
+            center=(float(self.centers[k, 0]), float(self.centers[k, 1])),
+            corners=self.corners[k],
+            size=float(self.sizes[k]),
+            distance=float(self.distances[k])
+        )
+
+class ArUcoDetector:
+    """ArUco marker detection and tracking."""
+    
+    # Smallest marker side (pixels, in the downscaled image) that is still
+    # reliably found; below this detection stays at full resolution
+    MIN_SCALED_MARKER_PX = 20
+    
+    # Up to this many markers, plain float math beats NumPy call overhead
+    SCALAR_MAX_MARKERS = 4
+    
+    def __init__(self, marker_size_cm: float = 10.0, scale: int = 2,
+                 use_umat: bool = False, max_perimeter_rate: float = 1.0):
+        """Initialize ArUco detector.
+        
+        Args:
+            marker_size_cm: Real-world marker size in centimeters
+            scale: Downscale factor for detection (1 = full resolution).
+                   Falls back to full resolution while markers are missed
+                   or too small to find in the downscaled image
+            use_umat: Run detection on a cv2.UMat so OpenCV's T-API can use
+                      OpenCL. Ignored when no OpenCL device is available
+            max_perimeter_rate: Largest marker perimeter accepted, relative
+                                to the larger image side. Raise it (to about
+                                4.0) for detectors that search tight crops
+                                around a marker
+        """
+        self.marker_size_cm = marker_size_cm
+        self.scale = max(1, int(scale))
+        self._active_scale = self.scale
+        self.use_umat = use_umat and cv2.ocl.haveOpenCL()
+        
+        # Reused per-frame buffers, reallocated only when the frame size changes
+        self._gray = None
+        self._small = None
+        
+        # Scratch arrays for the NumPy marker geometry, grown on demand
+        self._allocate_geometry_buffers(16)
+        
+        # Use 4x4 ArUco dictionary (smaller markers, easier to print).
+        # getPredefinedDictionary exists in both APIs; Dictionary_get was
+        # removed in 4.7
+        self.aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
+        if hasattr(cv2.aruco, 'ArucoDetector'):
+            # New API (OpenCV 4.7+): build the native detector once and
+            # reuse it for every frame
+            self.aruco_params = self._tune_parameters(cv2.aruco.DetectorParameters(),
+                                                      max_perimeter_rate)
+            self._detector = cv2.aruco.ArucoDetector(self.aruco_dict, self.aruco_params)
+            logger.debug("Using OpenCV 4.7+ ArucoDetector API")
+        else:
+            # Old API (OpenCV < 4.7)
+            self.aruco_params = self._tune_parameters(cv2.aruco.DetectorParameters_create(),
+                                                      max_perimeter_rate)
+            self._detector = None
+            logger.warning(f"OpenCV {cv2.__version__} has no ArucoDetector; using the slower "
+                           "legacy detectMarkers API (upgrade to 4.7+)")
+        
+        # Camera calibration for Innomaker 1080P 130° wide angle camera
+        # Wide angle lens has shorter focal length
+        # For 130° FOV at 1920x1080:
+        # focal_length_pixels ≈ (image_width / 2) / tan(FOV/2)
+        # focal_length_pixels ≈ (1920 / 2) / tan(65°) ≈ 448 pixels
+        # Adjusted for 640x480 capture: 448 * (640/1920) ≈ 149 pixels
+        # Only the focal length is used (distance from marker size); no pose
+        # estimation is done, so no distortion coefficients are kept
+        self.camera_matrix = np.array([
+            [149, 0, 320],  # Focal length and principal point x
+            [0, 149, 240],  # Focal length and principal point y
+            [0, 0, 1]
+        ], dtype=np.float32)
+    
+    @staticmethod
+    def _tune_parameters(params, max_perimeter_rate: float = 1.0):
+        """Narrow the detector search to the markers this robot tracks.
+        
+        The defaults threshold at three window sizes (3, 13, 23) and accept
+        any marker size; one mid-size window and a bounded perimeter range
+        cover 10cm markers from close-up to across the room.
+        """
+        # Single adaptive threshold pass, the hottest part of detection
+        params.adaptiveThreshWinSizeMin = 13
+        params.adaptiveThreshWinSizeMax = 13
+        params.adaptiveThreshWinSizeStep = 10
+        
+        # Marker perimeter relative to the larger image side. The default
+        # upper bound still allows a marker a quarter of the frame wide
+        params.minMarkerPerimeterRate = 0.05
+        params.maxMarkerPerimeterRate = max_perimeter_rate
+        params.polygonalApproxAccuracyRate = 0.05
+        
+        # Tracking, not surveying: skip sub-pixel corner refinement
+        params.cornerRefinementMethod = cv2.aruco.CORNER_REFINE_NONE
+        return params
+    
+    def _detect_corners(self, frame: np.ndarray, gray: Optional[np.ndarray]):
+        """Run the ArUco detector, returning OpenCV's (corners, ids).
+        
+        Detection runs on a downscaled copy when possible; corners are
+        always returned in full-frame pixel coordinates.
+        """
+        if gray is None:
+            if frame.ndim == 2:
+                gray = frame
+            else:
+                shape = frame.shape[:2]
+                if self._gray is None or self._gray.shape != shape:
+                    self._gray = np.empty(shape, dtype=np.uint8)
+                gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY, dst=self._gray)
+        
+        scale = self._active_scale
+        if scale > 1:
+            height, width = gray.shape
+            shape = (height // scale, width // scale)
+            if self._small is None or self._small.shape != shape:
+                self._small = np.empty(shape, dtype=np.uint8)
+            image = cv2.resize(gray, (shape[1], shape[0]), dst=self._small,
+                               interpolation=cv2.INTER_AREA)
+        else:
+            image = gray
+        
+        if self.use_umat:
+            image = cv2.UMat(image)
+        
+        if self._detector is not None:
+            corners, ids, _ = self._detector.detectMarkers(image)
+        else:
+            corners, ids, _ = cv2.aruco.detectMarkers(
+                image, self.aruco_dict, parameters=self.aruco_params
+            )
+        
+        if self.use_umat:
+            # A UMat input gives UMat outputs; the geometry works on NumPy
+            if isinstance(ids, cv2.UMat):
+                ids = ids.get()
+            if ids is not None and len(ids) == 0:
+                ids = None
+            corners = tuple(c.get() if isinstance(c, cv2.UMat) else c for c in corners)
+        
+        if ids is None:
+            # Missed: try the next frame at full resolution
+            self._active_scale = 1
+            return corners, ids
+        
+        if scale > 1:
+            corners = tuple(c * scale for c in corners)
+        
+        # Only go back to downscaling when every marker would stay
+        # large enough to be found in the smaller image
+        if self.scale > 1:
+            quads = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)
+            smallest = np.linalg.norm(quads[:, 0] - quads[:, 1], axis=1).min()
+            if smallest >= self.MIN_SCALED_MARKER_PX * self.scale:
+                self._active_scale = self.scale
+            else:
+                self._active_scale = 1
+        
+        return corners, ids
+    
+    def _allocate_geometry_buffers(self, capacity: int):
+        """(Re)allocate the per-marker scratch arrays for `capacity` markers."""
+        self._buf_edges = np.empty((capacity, 2, 2), dtype=np.float32)
+        self._buf_lens = np.empty((capacity, 2), dtype=np.float32)
+        self._buf_sizes = np.empty(capacity, dtype=np.float32)
+        self._buf_centers = np.empty((capacity, 2), dtype=np.float32)
+        self._buf_distances = np.empty(capacity, dtype=np.float32)
+    
+    def _marker_geometry(self, corners, scratch: bool = False):
+        """Compute corner quads, centers, sizes and distances for all markers.
+        
+        Args:
+            corners: Marker corners as returned by OpenCV
+            scratch: Write centers, sizes and distances into reused buffers.
+                     Only for callers that copy the values out before the
+                     next detection
+        
+        Returns:
+            Tuple of (quads (N, 4, 2), centers (N, 2), sizes (N,), distances_cm (N,))
+        """
+        quads = np.asarray(corners, dtype=np.float32).reshape(-1, 4, 2)
+        
+        # Estimate distance using calibrated focal length
+        # (149 pixels for wide angle)
+        marker_size_cm = float(self.marker_size_cm)
+        focal_length = float(self.camera_matrix[0, 0])
+        if NUMBA_AVAILABLE:
+            centers, sizes, distances = _corner_geometry(quads, marker_size_cm, focal_length)
+            return quads, centers, sizes, distances
+        k = marker_size_cm * focal_length
+        
+        n = quads.shape[0]
+        if n > self._buf_sizes.shape[0]:
+            self._allocate_geometry_buffers(max(n, 2 * self._buf_sizes.shape[0]))
+        
+        # Size is the average of width (corner 0-1) and height (corner 1-2)
+        edges = np.subtract(quads[:, 1:3], quads[:, 0:2], out=self._buf_edges[:n])
+        lens = np.einsum('nij,nij->ni', edges, edges, out=self._buf_lens[:n])
+        np.sqrt(lens, out=lens)
+        
+        if scratch:
+            sizes = np.mean(lens, axis=1, out=self._buf_sizes[:n])
+            centers = np.mean(quads, axis=1, out=self._buf_centers[:n])
+            distances = np.divide(k, sizes, out=self._buf_distances[:n])
+        else:
+            sizes = lens.mean(axis=1)
+            centers = quads.mean(axis=1)
+            distances = k / sizes
+        
+        return quads, centers, sizes, distances
+    
+    def detect_marker_arrays(self, frame: np.ndarray,
+                             gray: Optional[np.ndarray] = None
+                             ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Detect ArUco markers, returning parallel arrays instead of objects.
+        
+        Same measurements as detect_markers(), computed for all markers at
+        once. For control loops that only need centers and distances.
+        
+        Args:
+            frame: BGR frame, or an already single-channel grayscale frame
+            gray: Optional precomputed grayscale version of frame
+        
+        Returns:
+            Tuple of (ids (N,), centers (N, 2), distances_cm (N,))
+        """
+        corners, ids = self._detect_corners(frame, gray)
+        if ids is None:
+            return (np.empty(0, dtype=np.int32),
+                    np.empty((0, 2), dtype=np.float32),
+                    np.empty(0, dtype=np.float32))
+        
+        _, centers, _, distances = self._marker_geometry(corners)
+        return ids.ravel(), centers, distances
+    
+    def detect_marker_batch(self, frame: np.ndarray,
+                            gray: Optional[np.ndarray] = None) -> MarkerBatch:
+        """Detect ArUco markers, returning them as one MarkerBatch.
+        
+        Args:
+            frame: BGR frame, or an already single-channel grayscale frame
+            gray: Optional precomputed grayscale version of frame
+        
+        Returns:
+            MarkerBatch, empty when no marker was found
+        """
+        corners, ids = self._detect_corners(frame, gray)
+        if ids is None:
+            return MarkerBatch(ids=np.empty(0, dtype=np.int32),
+                               corners=np.empty((0, 4, 2), dtype=np.float32),
+                               centers=np.empty((0, 2), dtype=np.float32),
+                               sizes=np.empty(0, dtype=np.float32),
+                               distances=np.empty(0, dtype=np.float32))
+        
+        quads, centers, sizes, distances = self._marker_geometry(corners)
+        return MarkerBatch(ids=ids.ravel(), corners=quads, centers=centers,
+                           sizes=sizes, distances=distances)
+    
+    def detect_markers(self, frame: np.ndarray, 
+                       gray: Optional[np.ndarray] = None,
+                       only_ids: Optional[Set[int]] = None) -> Dict[int, MarkerInfo]:
+        """Detect ArUco markers in frame.
+        
+        Args:
+            frame: BGR frame, or an already single-channel grayscale frame
+            gray: Optional precomputed grayscale version of frame; when given
+                  the BGR->gray conversion is skipped
+            only_ids: Optional set of marker IDs to measure; other detected
+                      markers are dropped before any per-marker work
+        
+        Returns:
+            Dictionary of marker ID to MarkerInfo
+        """
+        corners, ids = self._detect_corners(frame, gray)
+        
+        markers = {}
+        if ids is None:
+            return markers
+        
+        if only_ids is not None:
+            keep = [i for i, marker_id in enumerate(ids.ravel().tolist())
+                    if marker_id in only_ids]
+            if not keep:
+                return markers
+            corners = [corners[i] for i in keep]
+            ids = ids[keep]
+        
+        if not NUMBA_AVAILABLE and len(ids) <= self.SCALAR_MAX_MARKERS:
+            # Few markers: unrolled Python float math on each quad
+            for marker_id, marker_corners in zip(ids.flatten(), corners):
+                markers[marker_id] = self.marker_from_corners(marker_id, marker_corners)
+        else:
+            # Values are copied into MarkerInfo below, so buffers are safe
+            quads, centers, sizes, distances = self._marker_geometry(corners, scratch=True)
+            for i, marker_id in enumerate(ids.flatten()):
+                markers[marker_id] = MarkerInfo(
+                    id=marker_id,
+                    center=(centers[i, 0], centers[i, 1]),
+                    corners=quads[i],
+                    size=sizes[i],
+                    distance=distances[i]
+                )
+        
+        return markers
+    
+    def marker_from_corners(self, marker_id: int, corners: np.ndarray) -> MarkerInfo:
+        """Build a MarkerInfo from one marker's four corners.
+        
+        For corners that did not come from detect_markers, e.g. tracked
+        from a previous detection.
+        
+        Args:
+            marker_id: Marker ID
+            corners: Corner points in full-frame pixels, (4, 2) or (1, 4, 2)
+        """
+        quad = corners.reshape(4, 2)
+        (x0, y0), (x1, y1), (x2, y2), (x3, y3) = quad.tolist()
+        
+        # Size is the average of width (corner 0-1) and height (corner 1-2)
+        size = (math.hypot(x1 - x0, y1 - y0) + math.hypot(x2 - x1, y2 - y1)) * 0.5
+        return MarkerInfo(
+            id=marker_id,
+            center=((x0 + x1 + x2 + x3) * 0.25, (y0 + y1 + y2 + y3) * 0.25),
+            corners=quad,
+            size=size,
+            distance=float(self.marker_size_cm) * float(self.camera_matrix[0, 0]) / size
+        )
+    
+    def draw_markers(self, frame: np.ndarray, markers: Dict[int, MarkerInfo]) -> np.ndarray:
+        """Draw detected markers on frame."""
+        annotated = frame.copy()
+        
+        for marker_id, info in markers.items():
+            # Draw marker outline
+            corners_int = info.corners.astype(int)
+            cv2.polylines(annotated, [corners_int], True, (0, 255, 0), 2)
+            
+            # Draw center
+            center_int = tuple(map(int, info.center))
+            cv2.circle(annotated, center_int, 5, (0, 0, 255), -1)
+            
+            # Draw ID and distance
+            text = f"ID:{marker_id} D:{info.distance:.1f}cm"
+            cv2.putText(annotated, text, 
+                       (corners_int[0][0], corners_int[0][1] - 10),
+                       cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        
+        # Draw center line
+        h, w = frame.shape[:2]
+        cv2.line(annotated, (w//2, 0), (w//2, h), (255, 0, 0), 1)
+        
+        return annotated
+    
+    def draw_marker_batch(self, frame: np.ndarray, batch: MarkerBatch,
+                          umat: bool = False):
+        """Draw a MarkerBatch on a copy of frame, like draw_markers().
+        
+        Args:
+            frame: BGR frame
+            batch: Detected markers
+            umat: Draw into a cv2.UMat (OpenCL T-API) instead of a NumPy copy
+        
+        Returns:
+            Annotated copy of frame, as a cv2.UMat when umat is set
+        """
+        annotated = cv2.UMat(frame) if umat else frame.copy()
+        
+        if len(batch):
+            # All outlines in one call
+            corners_int = batch.corners.astype(np.int32)
+            cv2.polylines(annotated, list(corners_int), True, (0, 255, 0), 2)
+            
+            centers_int = batch.centers.astype(np.int32).tolist()
+            origins = corners_int[:, 0].tolist()
+            for marker_id, center, origin, distance in zip(
+                    batch.ids.tolist(), centers_int, origins, batch.distances.tolist()):
+                # Draw center
+                cv2.circle(annotated, tuple(center), 5, (0, 0, 255), -1)
+                
+                # Draw ID and distance
+                cv2.putText(annotated, f"ID:{marker_id} D:{distance:.1f}cm",
+                           (origin[0], origin[1] - 10),
+                           cv2.FONT_HERSHEY_SIMPLEX, 0.5, (0, 255, 0), 2)
+        
+        # Draw center line
+        h, w = frame.shape[:2]
+        cv2.line(annotated, (w//2, 0), (w//2, h), (255, 0, 0), 1)
+        
+        return annotated
+
+# One detector per detection worker process, built on first use
+_worker_detector = None
+
+def configure_cv_threads(num_threads: Optional[int] = None):
+    """Set the thread count for OpenCV's parallel loops in this process.
+    
+    Used as a detection worker's initializer; num_threads None means every
+    core.
+    """
+    cv2.setUseOptimized(True)
+    cv2.setNumThreads(num_threads or os.cpu_count() or 4)
+
+def detect_in_worker(frame: np.ndarray, marker_size_cm: float, scale: int,
+                     only_ids: Optional[Set[int]] = None,
+                     use_umat: bool = False) -> Dict[int, MarkerInfo]:
+    """Detect markers in a detection worker process.
+    
+    Submitted to a ProcessPoolExecutor; lives here so the worker imports
+    only this module.
+    """
+    global _worker_detector
+    if (_worker_detector is None or _worker_detector.scale != scale or
+            _worker_detector.use_umat != use_umat or
+            _worker_detector.marker_size_cm != marker_size_cm):
+        _worker_detector = ArUcoDetector(marker_size_cm=marker_size_cm, scale=scale,
+                                         use_umat=use_umat)
+    return _worker_detector.detect_markers(frame, only_ids=only_ids)
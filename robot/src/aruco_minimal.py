@@ -45,10 +45,31 @@ def main():
         print("Cannot open camera")
         return 1
     
+    # Keep only the newest frame in the driver queue so grab() is not stale
+    if not inputVideo.set(cv2.CAP_PROP_BUFFERSIZE, 1):
+        print("Warning: camera does not support CAP_PROP_BUFFERSIZE")
+    
+    # MJPG keeps 720p within the USB bandwidth budget
+    if not inputVideo.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc('M', 'J', 'P', 'G')):
+        print("Warning: camera does not support MJPG")
+    
     # Set resolution
     inputVideo.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
     inputVideo.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
     
+    # Ask for the rate we consume at so the driver does not queue frames
+    inputVideo.set(cv2.CAP_PROP_FPS, 30)
+    
+    # Report what the driver actually accepted
+    fourcc = int(inputVideo.get(cv2.CAP_PROP_FOURCC))
+    fourcc_str = "".join(chr((fourcc >> (8 * i)) & 0xFF) for i in range(4))
+    print(f"Camera format: {fourcc_str} "
+          f"{int(inputVideo.get(cv2.CAP_PROP_FRAME_WIDTH))}x"
+          f"{int(inputVideo.get(cv2.CAP_PROP_FRAME_HEIGHT))} "
+          f"@ {inputVideo.get(cv2.CAP_PROP_FPS):.0f} fps")
+    if fourcc_str != "MJPG":
+        print("Warning: camera is not delivering MJPG, 720p may be limited to ~10 fps")
+    
     print("Starting detection (press 'q' or ESC to quit)...")
     waitTime = 10
     
@@ -6,10 +6,16 @@ import numpy as np
 import time
 import logging
 import json
+import gc
 import os
-from typing import Optional, Dict, List, Tuple
+import multiprocessing
+import struct
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional, Dict, List, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
+from queue import Queue, Empty
 import threading
 
 try:
@@ -22,7 +28,9 @@ except ImportError:
     print("Warning: gpiozero not available, running in simulation mode")
 
 from .camera import CameraInterface
-from .aruco_center_demo import MarkerInfo, ArUcoDetector
+from .aruco_detector import (
+    MarkerInfo, ArUcoDetector, configure_cv_threads, detect_in_worker
+)
 from .camera_config import (
     CAMERA_MATRIX, DISTORTION_COEFFS, MARKER_SIZE_CM,
     DEFAULT_TARGET_DISTANCE_CM, TOLERANCE_X_PIXELS, 
@@ -36,6 +44,21 @@ if HARDWARE_AVAILABLE:
     )
     from .motor_gpiozero import BTS7960Motor
 
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; positions are then written with the json module
+    orjson = None
+
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the alignment step runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -49,9 +72,12 @@ class NavigationState(Enum):
     ALIGNED = "aligned"
     ERROR = "error"
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MarkerPosition:
-    """Saved position for a specific ArUco marker."""
+    """Saved position for a specific ArUco marker.
+    
+    Immutable; replace the entry in saved_positions to change a position.
+    """
     marker_id: int
     name: str
     target_x: float  # Target X position in frame (pixels)
@@ -69,6 +95,68 @@ class MarkerPosition:
     def from_dict(cls, data):
         return cls(**data)
 
+# Binary mirror of the positions file, read at startup instead of parsing
+# JSON. Header is magic + record count; each record is the marker ID, the
+# name (UTF-8, NUL padded) and the seven float fields in MarkerPosition order
+_POSITIONS_MAGIC = b'BBP1'
+_POSITIONS_HEADER = struct.Struct('<4sI')
+_POSITION_RECORD = struct.Struct('<i32s7d')
+
+def _write_atomic(path: str, payload: bytes):
+    """Write payload to a temp file and rename it over path.
+    
+    An interrupted write never leaves a truncated file behind.
+    """
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(payload)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+@njit(cache=True)
+def _alignment_step(x_error, y_error, size_error, tolerance_x, tolerance_y, tolerance_size,
+                    x_integral, y_integral, last_x_error, last_y_error,
+                    kp_x, ki_x, kd_x, kp_y, ki_y, kd_y, dt, inv_dt, limit, min_speed):
+    """PrecisionAlignmentController arithmetic, all scalars.
+    
+    Returns:
+        Tuple of (left_speed, right_speed, is_aligned, x_integral, y_integral)
+    """
+    # Check if aligned within tolerance
+    if (abs(x_error) <= tolerance_x and abs(y_error) <= tolerance_y and
+            abs(size_error) <= tolerance_size):
+        return 0.0, 0.0, True, x_integral, y_integral
+    
+    # Update integral terms, clamped to prevent windup
+    x_integral = max(-50.0, min(50.0, x_integral + x_error * dt))
+    y_integral = max(-50.0, min(50.0, y_integral + y_error * dt))
+    
+    # Calculate derivatives
+    x_derivative = (x_error - last_x_error) * inv_dt
+    y_derivative = (y_error - last_y_error) * inv_dt
+    
+    # PID control
+    turn_control = kp_x * x_error + ki_x * x_integral + kd_x * x_derivative
+    
+    # Use size error as proxy for distance
+    forward_control = kp_y * size_error + ki_y * y_integral + kd_y * y_derivative
+    
+    # Convert to motor speeds and apply speed limits
+    left_speed = max(-limit, min(limit, forward_control - turn_control))
+    right_speed = max(-limit, min(limit, forward_control + turn_control))
+    
+    # Apply minimum speed threshold for movement
+    if abs(left_speed) < min_speed and left_speed != 0:
+        left_speed = min_speed if left_speed > 0 else -min_speed
+    if abs(right_speed) < min_speed and right_speed != 0:
+        right_speed = min_speed if right_speed > 0 else -min_speed
+    
+    return left_speed, right_speed, False, x_integral, y_integral
+
 class PrecisionAlignmentController:
     """High precision alignment controller for close-in marker positioning."""
     
@@ -85,116 +173,236 @@ class PrecisionAlignmentController:
         
         self.kp_rot = 0.1  # Proportional gain for rotation alignment
         
+        # Control period assumed by the integral and derivative terms
+        self._dt = 0.05
+        self._inv_dt = 1.0 / self._dt
+        
         # State variables
-        self.x_integral = 0
-        self.y_integral = 0
-        self.last_x_error = 0
-        self.last_y_error = 0
+        self.x_integral = 0.0
+        self.y_integral = 0.0
+        self.last_x_error = 0.0
+        self.last_y_error = 0.0
         
         # Speed limits for precision mode
         self.max_linear_speed = 20  # Maximum forward/backward speed
         self.max_turn_speed = 15  # Maximum turning speed
         self.min_speed = 8  # Minimum speed threshold
         
+        # Per-call constants, rebuilt on reset() so gain or limit changes
+        # take effect at the next alignment
+        self._gains = ()
+        self._limits = ()
+        self._target = None
+        self._target_params = ()
+        self.reset()
+        
+        # Compile (or load the cached) alignment step now rather than on
+        # the first navigation frame
+        _alignment_step(1.0, 1.0, 1.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0,
+                        0.0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.05, 20.0, 1.0, 0.0)
+        
     def reset(self):
         """Reset controller state."""
-        self.x_integral = 0
-        self.y_integral = 0
-        self.last_x_error = 0
-        self.last_y_error = 0
+        self.x_integral = 0.0
+        self.y_integral = 0.0
+        self.last_x_error = 0.0
+        self.last_y_error = 0.0
+        
+        self._gains = (float(self.kp_x), float(self.ki_x), float(self.kd_x),
+                       float(self.kp_y), float(self.ki_y), float(self.kd_y))
+        self._limits = (float(self.max_linear_speed), float(self.min_speed))
+        self._target = None
     
-    def compute_alignment(self, current: MarkerInfo, target: MarkerPosition) -> Tuple[float, float, bool]:
+    def compute_alignment(self, current: MarkerInfo, target: MarkerPosition,
+                          dt: Optional[float] = None) -> Tuple[float, float, bool]:
         """Compute motor speeds for precise alignment.
         
+        Args:
+            current: Latest detection of the target marker
+            target: Saved position to align to
+            dt: Seconds since the previous call; defaults to the nominal
+                control period
+        
         Returns:
             Tuple of (left_speed, right_speed, is_aligned)
         """
-        # Calculate errors
-        x_error = target.target_x - current.center[0]
-        y_error = target.target_y - current.center[1]
-        size_error = target.target_size - current.size
-        
-        # Check if aligned within tolerance
-        is_aligned = (
-            abs(x_error) <= target.tolerance_x and
-            abs(y_error) <= target.tolerance_y and
-            abs(size_error) <= target.tolerance_size
-        )
+        # The same target is used for a whole navigation, so unpack it once
+        if target is not self._target:
+            self._target = target
+            self._target_params = (
+                float(target.target_x), float(target.target_y), float(target.target_size),
+                float(target.tolerance_x), float(target.tolerance_y),
+                float(target.tolerance_size)
+            )
+        tx, ty, ts, tol_x, tol_y, tol_size = self._target_params
+        cx, cy = current.center
         
-        if is_aligned:
-            return 0, 0, True
+        # Calculate errors (as Python floats, never NumPy scalars)
+        x_error = tx - float(cx)
+        y_error = ty - float(cy)
+        size_error = ts - float(current.size)
         
-        # Update integral terms
-        self.x_integral += x_error * 0.05  # dt ~ 0.05s
-        self.y_integral += y_error * 0.05
+        if dt is None:
+            dt, inv_dt = self._dt, self._inv_dt
+        else:
+            inv_dt = 1.0 / dt
         
-        # Clamp integrals to prevent windup
-        self.x_integral = np.clip(self.x_integral, -50, 50)
-        self.y_integral = np.clip(self.y_integral, -50, 50)
+        left_speed, right_speed, is_aligned, x_integral, y_integral = _alignment_step(
+            x_error, y_error, size_error, tol_x, tol_y, tol_size,
+            self.x_integral, self.y_integral, self.last_x_error, self.last_y_error,
+            *self._gains, dt, inv_dt, *self._limits
+        )
+        self.x_integral = x_integral
+        self.y_integral = y_integral
         
-        # Calculate derivatives
-        x_derivative = (x_error - self.last_x_error) / 0.05
-        y_derivative = (y_error - self.last_y_error) / 0.05
+        if is_aligned:
+            return 0, 0, True
         
         self.last_x_error = x_error
         self.last_y_error = y_error
-        
-        # PID control
-        turn_control = (
-            self.kp_x * x_error +
-            self.ki_x * self.x_integral +
-            self.kd_x * x_derivative
-        )
-        
-        # Use size error as proxy for distance
-        forward_control = (
-            self.kp_y * size_error +
-            self.ki_y * self.y_integral +
-            self.kd_y * y_derivative
-        )
-        
-        # Convert to motor speeds
-        left_speed = forward_control - turn_control
-        right_speed = forward_control + turn_control
-        
-        # Apply speed limits
-        left_speed = np.clip(left_speed, -self.max_linear_speed, self.max_linear_speed)
-        right_speed = np.clip(right_speed, -self.max_linear_speed, self.max_linear_speed)
-        
-        # Apply minimum speed threshold for movement
-        if abs(left_speed) < self.min_speed and left_speed != 0:
-            left_speed = self.min_speed if left_speed > 0 else -self.min_speed
-        if abs(right_speed) < self.min_speed and right_speed != 0:
-            right_speed = self.min_speed if right_speed > 0 else -self.min_speed
-        
         return left_speed, right_speed, False
 
+class MarkerTracker:
+    """Constant-velocity Kalman filter over the target marker's center.
+    
+    Lets the navigation loop skip detection on some frames and act on a
+    predicted center instead; size and distance are held at their last
+    measured values.
+    """
+    
+    def __init__(self):
+        """Initialize tracker."""
+        self._kf = cv2.KalmanFilter(4, 2)  # State [x, y, vx, vy]
+        self._kf.measurementMatrix = np.array([[1, 0, 0, 0],
+                                               [0, 1, 0, 0]], np.float32)
+        self._kf.processNoiseCov = np.eye(4, dtype=np.float32) * 1e-1
+        self._kf.measurementNoiseCov = np.eye(2, dtype=np.float32) * 2.0
+        self._transition = np.eye(4, dtype=np.float32)
+        self._measurement = np.zeros((2, 1), np.float32)
+        self.last: Optional[MarkerInfo] = None  # Last measured marker
+    
+    @property
+    def active(self) -> bool:
+        """Whether the tracker has a measurement to predict from."""
+        return self.last is not None
+    
+    def reset(self):
+        """Forget the tracked marker."""
+        self.last = None
+    
+    def _predict(self, dt: float) -> np.ndarray:
+        self._transition[0, 2] = dt
+        self._transition[1, 3] = dt
+        self._kf.transitionMatrix = self._transition
+        return self._kf.predict()
+    
+    def update(self, marker: MarkerInfo, dt: float):
+        """Feed a measured marker, dt seconds after the previous frame."""
+        self._measurement[0, 0] = marker.center[0]
+        self._measurement[1, 0] = marker.center[1]
+        if self.last is None:
+            self._kf.statePost = np.array([[marker.center[0]], [marker.center[1]],
+                                           [0.0], [0.0]], np.float32)
+            self._kf.errorCovPost = np.eye(4, dtype=np.float32)
+        else:
+            self._predict(dt)
+            self._kf.correct(self._measurement)
+        self.last = marker
+    
+    def predict(self, dt: float) -> MarkerInfo:
+        """Predict the marker dt seconds after the previous frame."""
+        # predict() also copies the prediction into the posterior, so
+        # consecutive predictions chain without a correct() in between
+        state = self._predict(dt)
+        last = self.last
+        return MarkerInfo(id=last.id, center=(float(state[0, 0]), float(state[1, 0])),
+                          corners=last.corners, size=last.size, distance=last.distance)
+
 class ArUcoNavigator:
     """Main navigation system for moving between ArUco markers."""
     
-    def __init__(self, simulation_mode: bool = False):
-        """Initialize navigator."""
+    LOG_INTERVAL = 1.0  # Minimum seconds between repeats of a nav-loop message
+    
+    def __init__(self, simulation_mode: bool = False, detect_process: bool = False,
+                 detect_scale: int = 2, detect_interval: int = 2,
+                 cv_threads: Optional[int] = None):
+        """Initialize navigator.
+        
+        Args:
+            simulation_mode: Run without motors
+            detect_process: Run navigation-loop detection in a separate
+                            process, overlapping it with motor control. Each
+                            frame is pickled across the process boundary, so
+                            this is opt-in
+            detect_scale: Downscale factor for detection. Marker centers and
+                          sizes are always reported in full-frame pixels, so
+                          saved positions and tolerances are unaffected; the
+                          detector drops to full resolution while the marker
+                          is lost or too small
+            detect_interval: While tracking the target, run detection on
+                             every Nth frame and use a Kalman prediction of
+                             its center in between. 1 detects every frame
+            cv_threads: OpenCV threads for the detection process (None =
+                        every core). OpenCV settings of the host process
+                        are left alone
+        """
         self.simulation_mode = simulation_mode or not HARDWARE_AVAILABLE
         
+        # BEVBOT_OPENCL=0 forces the plain NumPy detection path for comparison
+        self.use_opencl = (cv2.ocl.haveOpenCL() and
+                           os.environ.get('BEVBOT_OPENCL', '1') != '0')
+        logger.info(f"OpenCL detection path: {'on' if self.use_opencl else 'off'}")
+        
         # Components
         self.camera = None
-        self.detector = ArUcoDetector(marker_size_cm=MARKER_SIZE_CM)  # Use 100mm markers
+        self.detect_scale = detect_scale
+        self.detector = ArUcoDetector(marker_size_cm=MARKER_SIZE_CM,  # Use 100mm markers
+                                      scale=detect_scale, use_umat=self.use_opencl)
         self.precision_controller = PrecisionAlignmentController()
+        self.detect_interval = max(1, detect_interval)
+        self.max_prediction_age = 0.1  # Always detect after this many seconds
+        self._tracker = MarkerTracker()
+        self._predicted = False  # Whether the handlers are seeing a prediction
+        self._log_times: Dict[str, float] = {}
+        
+        # Detection worker; forkserver so the worker is not forked from a
+        # process that is already running camera threads
+        self._detect_pool = None
+        if detect_process:
+            try:
+                self._detect_pool = ProcessPoolExecutor(
+                    max_workers=1, mp_context=multiprocessing.get_context('forkserver'),
+                    initializer=configure_cv_threads, initargs=(cv_threads,)
+                )
+            except (OSError, ValueError) as e:
+                logger.warning(f"Detection process unavailable, detecting in-process: {e}")
         
         # Motors
         self.left_motor = None
         self.right_motor = None
+        self._last_cmd = None  # Last (left, right) sent, rounded to 0.1
         
         # State
         self.state = NavigationState.IDLE
         self.current_target = None
+        self._handlers = {
+            NavigationState.SEARCHING: self._handle_search,
+            NavigationState.APPROACHING: self._handle_approach,
+            NavigationState.ALIGNING: self._handle_align,
+        }
         self.saved_positions: Dict[int, MarkerPosition] = {}
         self.positions_file = "marker_positions.json"
+        self._dirty = False
         
         # Navigation thread
         self.nav_thread = None
         self.nav_running = False
         
+        # Position files are written on a background thread; None stops it
+        self._save_queue: Queue = Queue()
+        self._save_thread = threading.Thread(target=self._save_worker, daemon=True)
+        self._save_thread.start()
+        
         if not self.simulation_mode:
             self._init_hardware()
         
@@ -236,6 +444,10 @@ class ArUcoNavigator:
             self.camera = CameraInterface()
             if self.camera.is_available():
                 self.camera.start()
+                # Capture on a background thread so the navigation loop
+                # only waits for detection, never for the driver. Grayscale
+                # keeps frames sent to the detection process small
+                self.camera.start_async(gray=True)
                 logger.info("Camera initialized")
                 return True
             else:
@@ -277,20 +489,23 @@ class ArUcoNavigator:
         
         marker = markers[marker_id]
         
-        # Save position
+        # Save position as Python floats: the detector may hand back NumPy
+        # scalars, which are slower in the control loop and not JSON
+        # serializable
         position = MarkerPosition(
             marker_id=marker_id,
             name=name or f"Position_{marker_id}",
-            target_x=marker.center[0],
-            target_y=marker.center[1],
-            target_size=marker.size,
-            target_distance=marker.distance,
+            target_x=float(marker.center[0]),
+            target_y=float(marker.center[1]),
+            target_size=float(marker.size),
+            target_distance=float(marker.distance),
             tolerance_x=tolerance_x,
             tolerance_y=tolerance_y,
             tolerance_size=tolerance_size
         )
         
         self.saved_positions[marker_id] = position
+        self._dirty = True
         self.save_positions()
         
         logger.info(f"Saved position for marker {marker_id}:")
@@ -300,17 +515,151 @@ class ArUcoNavigator:
         
         return True
     
+    def _submit_detection(self, frame: np.ndarray,
+                          only_ids: Optional[Set[int]] = None) -> Future:
+        """Start detecting markers in frame, in the worker process if available."""
+        if self._detect_pool is not None:
+            try:
+                return self._detect_pool.submit(detect_in_worker, frame, MARKER_SIZE_CM,
+                                                self.detect_scale, only_ids,
+                                                self.use_opencl)
+            except BrokenProcessPool as e:
+                logger.error(f"Detection process failed, detecting in-process: {e}")
+                self._detect_pool = None
+        
+        future = Future()
+        future.set_result(self.detector.detect_markers(frame, only_ids=only_ids))
+        return future
+    
+    def delete_position(self, marker_id: int) -> bool:
+        """Delete a saved position and persist the change.
+        
+        Returns:
+            True if a position was deleted
+        """
+        if self.saved_positions.pop(marker_id, None) is None:
+            return False
+        self._dirty = True
+        self.save_positions()
+        return True
+    
     def save_positions(self):
-        """Save all positions to file."""
+        """Save all positions to file if they changed since the last save.
+        
+        Returns immediately; the file is written on a background thread,
+        and saves queued faster than the disk keeps up are coalesced.
+        cleanup() waits for the last one.
+        """
+        if not self._dirty:
+            return
+        
+        # Positions are immutable, so a shallow copy is a consistent snapshot
+        self._save_queue.put((self.positions_file, list(self.saved_positions.values())))
+        self._dirty = False
+    
+    def _save_worker(self):
+        """Write queued position snapshots, keeping only the newest."""
+        stopping = False
+        while not stopping:
+            snapshot = self._save_queue.get()
+            while True:
+                try:
+                    newer = self._save_queue.get_nowait()
+                except Empty:
+                    break
+                if newer is None:
+                    stopping = True
+                else:
+                    snapshot = newer
+            if snapshot is None:
+                return
+            
+            path, positions = snapshot
+            try:
+                self._write_positions(path, positions)
+            except Exception as e:
+                logger.error(f"Failed to save positions: {e}")
+                self._dirty = True  # Retry on the next save
+    
+    def _write_positions(self, path: str, positions: List[MarkerPosition]):
+        """Write positions to path and its binary mirror."""
         data = {
-            'positions': [pos.to_dict() for pos in self.saved_positions.values()],
+            'positions': [pos.to_dict() for pos in positions],
             'updated': time.strftime('%Y-%m-%d %H:%M:%S')
         }
         
-        with open(self.positions_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        if orjson is not None:
+            payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(data, indent=2).encode('utf-8')
+        _write_atomic(path, payload)
+        
+        # JSON stays the file of record; the binary copy is written after it
+        # so it is only trusted while it is at least as new
+        self._save_positions_binary(self._binary_path(path), positions)
+        
+        logger.info(f"Saved {len(positions)} positions to {path}")
+    
+    @staticmethod
+    def _binary_path(path: str) -> str:
+        return os.path.splitext(path)[0] + '.bin'
+    
+    @property
+    def positions_binary_file(self) -> str:
+        """Path of the binary mirror of positions_file."""
+        return self._binary_path(self.positions_file)
+    
+    def _save_positions_binary(self, path: str, positions: List[MarkerPosition]):
+        """Write the binary mirror of a positions file."""
+        records = []
+        for pos in positions:
+            name = pos.name.encode('utf-8')
+            if len(name) > 32:
+                # Would be truncated; leave this save to the JSON file alone
+                if os.path.exists(path):
+                    os.remove(path)
+                return
+            records.append(_POSITION_RECORD.pack(
+                pos.marker_id, name, pos.target_x, pos.target_y,
+                pos.target_size, pos.target_distance,
+                pos.tolerance_x, pos.tolerance_y, pos.tolerance_size
+            ))
+        
+        header = _POSITIONS_HEADER.pack(_POSITIONS_MAGIC, len(records))
+        try:
+            _write_atomic(path, header + b''.join(records))
+        except OSError as e:
+            logger.warning(f"Failed to write {path}: {e}")
+    
+    def _load_positions_binary(self) -> Optional[Dict[int, MarkerPosition]]:
+        """Read the binary mirror if it is current.
+        
+        Returns:
+            Positions by marker ID, or None if the binary file is missing,
+            older than positions_file or not in the expected format
+        """
+        path = self.positions_binary_file
+        try:
+            if os.path.getmtime(path) < os.path.getmtime(self.positions_file):
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            return None
         
-        logger.info(f"Saved {len(self.saved_positions)} positions to {self.positions_file}")
+        if len(data) < _POSITIONS_HEADER.size:
+            return None
+        magic, count = _POSITIONS_HEADER.unpack_from(data)
+        body = memoryview(data)[_POSITIONS_HEADER.size:]
+        if magic != _POSITIONS_MAGIC or len(body) != count * _POSITION_RECORD.size:
+            return None
+        
+        positions = {}
+        for marker_id, name, *values in _POSITION_RECORD.iter_unpack(body):
+            positions[marker_id] = MarkerPosition(
+                marker_id, name.rstrip(b'\0').decode('utf-8'), *values
+            )
+        return positions
     
     def load_positions(self):
         """Load saved positions from file."""
@@ -318,6 +667,13 @@ class ArUcoNavigator:
             logger.info("No saved positions file found")
             return
         
+        positions = self._load_positions_binary()
+        if positions is not None:
+            self.saved_positions = positions
+            self._dirty = False
+            logger.info(f"Loaded {len(self.saved_positions)} saved positions")
+            return
+        
         try:
             with open(self.positions_file, 'r') as f:
                 data = json.load(f)
@@ -326,6 +682,7 @@ class ArUcoNavigator:
             for pos_data in data['positions']:
                 pos = MarkerPosition.from_dict(pos_data)
                 self.saved_positions[pos.marker_id] = pos
+            self._dirty = False
             
             logger.info(f"Loaded {len(self.saved_positions)} saved positions")
         except Exception as e:
@@ -345,79 +702,80 @@ class ArUcoNavigator:
             logger.error(f"No saved position for marker {marker_id}")
             return False
         
+        # Keep cyclic GC pauses out of the control loop; reference counting
+        # still frees per-frame objects, and cycles are collected afterwards
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return self._navigate(marker_id, timeout)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+                gc.collect()
+    
+    def _navigate(self, marker_id: int, timeout: float) -> bool:
+        """Run navigate_to_marker's control loop for a saved marker."""
         self.current_target = self.saved_positions[marker_id]
         self.state = NavigationState.SEARCHING
         
         logger.info(f"Starting navigation to marker {marker_id} ({self.current_target.name})")
         
         start_time = time.time()
+        # Only the target marker is measured; others in view are skipped
+        target_ids = {marker_id}
+        tracker = self._tracker
+        tracker.reset()
+        frame, last_timestamp = self.camera.wait_for_frame()
+        pending = self._submit_detection(frame, target_ids)
+        last_detect_time = last_timestamp
+        frames_since_detect = 0
+        # No interval yet for the first frame; the controller then uses its
+        # nominal period
+        frame_dt = None
+        
+        # Frame size is fixed for the whole run
+        center_x = frame.shape[1] * 0.5
         
         while time.time() - start_time < timeout:
-            # Get current frame
-            frame, _ = self.camera.capture_frame()
-            markers = self.detector.detect_markers(frame)
-            
-            if self.state == NavigationState.SEARCHING:
+            if pending is not None:
+                try:
+                    markers = pending.result()
+                except BrokenProcessPool as e:
+                    logger.error(f"Detection process failed, detecting in-process: {e}")
+                    self._detect_pool = None
+                    markers = self.detector.detect_markers(frame, only_ids=target_ids)
+                
                 if marker_id in markers:
-                    logger.info(f"Found marker {marker_id}, approaching...")
-                    self.state = NavigationState.APPROACHING
-                    self.precision_controller.reset()
+                    tracker.update(markers[marker_id], frame_dt)
                 else:
-                    # Slow rotation to search for marker
-                    self._set_motor_speeds(-15, 15)  # Turn in place
-                    time.sleep(0.1)
-                    continue
+                    tracker.reset()
+                self._predicted = False
+            else:
+                markers = {marker_id: tracker.predict(frame_dt)}
+                self._predicted = True
             
-            elif self.state == NavigationState.APPROACHING:
-                if marker_id not in markers:
-                    logger.warning("Lost marker, searching again...")
-                    self.state = NavigationState.SEARCHING
-                    continue
-                
-                marker = markers[marker_id]
-                
-                # Check if close enough for precision alignment
-                size_ratio = marker.size / self.current_target.target_size
-                if size_ratio > 0.7:  # Within 70% of target size
-                    logger.info("Close enough, switching to precision alignment")
-                    self.state = NavigationState.ALIGNING
-                    self.precision_controller.reset()
-                else:
-                    # Simple approach control
-                    center_x = frame.shape[1] / 2
-                    x_error = marker.center[0] - center_x
-                    
-                    # Basic proportional control
-                    turn = x_error * 0.05
-                    forward = 25  # Fixed approach speed
-                    
-                    left = forward - turn
-                    right = forward + turn
-                    
-                    self._set_motor_speeds(left, right)
-                    time.sleep(0.05)
+            # Act on this frame before waiting for the next, so motor
+            # commands go out as soon as the detection is in
+            if self._handlers[self.state](marker_id, markers, center_x, frame_dt):
+                return True
             
-            elif self.state == NavigationState.ALIGNING:
-                if marker_id not in markers:
-                    logger.warning("Lost marker during alignment, searching...")
-                    self.state = NavigationState.SEARCHING
-                    continue
-                
-                marker = markers[marker_id]
-                
-                # Use precision controller
-                left, right, aligned = self.precision_controller.compute_alignment(
-                    marker, self.current_target
-                )
-                
-                if aligned:
-                    logger.info(f"Successfully aligned with marker {marker_id}!")
-                    self.state = NavigationState.ALIGNED
-                    self._stop_motors()
-                    return True
-                
-                self._set_motor_speeds(left, right)
-                time.sleep(0.05)
+            # Waiting for the next frame paces the loop to the camera, so
+            # the motor commands need no sleep of their own
+            frame, timestamp = self.camera.wait_for_frame(last_timestamp)
+            frame_dt = max(timestamp - last_timestamp, 1e-3)
+            last_timestamp = timestamp
+            
+            # While the target is tracked, detect only every detect_interval
+            # frames and predict in between
+            frames_since_detect += 1
+            if (self.state != NavigationState.SEARCHING and tracker.active and
+                    frames_since_detect < self.detect_interval and
+                    timestamp - last_detect_time < self.max_prediction_age):
+                pending = None
+            else:
+                pending = self._submit_detection(frame, target_ids)
+                last_detect_time = timestamp
+                frames_since_detect = 0
         
         # Timeout reached
         logger.error(f"Navigation timeout reached for marker {marker_id}")
@@ -425,6 +783,94 @@ class ArUcoNavigator:
         self.state = NavigationState.ERROR
         return False
     
+    def _log_throttled(self, level: int, msg: str, *args):
+        """Log msg at most once per LOG_INTERVAL, formatting args lazily.
+        
+        For transitions that repeat every few frames when a marker flickers
+        at the edge of detection.
+        """
+        now = time.monotonic()
+        if now - self._log_times.get(msg, float('-inf')) < self.LOG_INTERVAL:
+            return
+        self._log_times[msg] = now
+        logger.log(level, msg, *args)
+    
+    def _handle_search(self, marker_id: int, markers: Dict[int, MarkerInfo],
+                       center_x: float, frame_dt: Optional[float]) -> bool:
+        """SEARCHING: turn in place until the marker is seen."""
+        if marker_id in markers:
+            self._log_throttled(logging.INFO, "Found marker %d, approaching...", marker_id)
+            self.state = NavigationState.APPROACHING
+            self.precision_controller.reset()
+        else:
+            # Slow rotation to search for marker
+            self._set_motor_speeds(-15, 15)  # Turn in place
+            time.sleep(0.1)
+        return False
+    
+    def _handle_approach(self, marker_id: int, markers: Dict[int, MarkerInfo],
+                         center_x: float, frame_dt: Optional[float]) -> bool:
+        """APPROACHING: drive toward the marker until it is nearly target size."""
+        if marker_id not in markers:
+            self._log_throttled(logging.WARNING, "Lost marker, searching again...")
+            self.state = NavigationState.SEARCHING
+            return False
+        
+        marker = markers[marker_id]
+        
+        # Check if close enough for precision alignment
+        size_ratio = marker.size / self.current_target.target_size
+        if size_ratio > 0.7:  # Within 70% of target size
+            logger.info("Close enough, switching to precision alignment")
+            self.state = NavigationState.ALIGNING
+            self.precision_controller.reset()
+        else:
+            # Simple approach control
+            x_error = marker.center[0] - center_x
+            
+            # Basic proportional control
+            turn = x_error * 0.05
+            forward = 25  # Fixed approach speed
+            
+            left = forward - turn
+            right = forward + turn
+            
+            self._set_motor_speeds(left, right)
+        return False
+    
+    def _handle_align(self, marker_id: int, markers: Dict[int, MarkerInfo],
+                      center_x: float, frame_dt: Optional[float]) -> bool:
+        """ALIGNING: precision control to the saved position.
+        
+        Returns:
+            True once aligned
+        """
+        if marker_id not in markers:
+            self._log_throttled(logging.WARNING, "Lost marker during alignment, searching...")
+            self.state = NavigationState.SEARCHING
+            return False
+        
+        marker = markers[marker_id]
+        
+        # Use precision controller
+        left, right, aligned = self.precision_controller.compute_alignment(
+            marker, self.current_target, frame_dt
+        )
+        
+        if aligned and self._predicted:
+            # Hold still and confirm on the next detected frame
+            self._stop_motors()
+            return False
+        
+        if aligned:
+            logger.info(f"Successfully aligned with marker {marker_id}!")
+            self.state = NavigationState.ALIGNED
+            self._stop_motors()
+            return True
+        
+        self._set_motor_speeds(left, right)
+        return False
+    
     def navigate_sequence(self, marker_ids: List[int], pause_time: float = 2.0):
         """Navigate through a sequence of markers.
         
@@ -450,7 +896,12 @@ class ArUcoNavigator:
         self._stop_motors()
     
     def _set_motor_speeds(self, left: float, right: float):
-        """Set motor speeds."""
+        """Set motor speeds, skipping a repeat of the last command."""
+        cmd = (round(left, 1), round(right, 1))
+        if cmd == self._last_cmd:
+            return
+        self._last_cmd = cmd
+        
         if not self.simulation_mode:
             self.left_motor.drive(left)
             self.right_motor.drive(right)
@@ -463,6 +914,14 @@ class ArUcoNavigator:
         """Clean up resources."""
         self._stop_motors()
         
+        # Let any queued position save finish
+        self._save_queue.put(None)
+        self._save_thread.join(timeout=5.0)
+        
+        if self._detect_pool is not None:
+            self._detect_pool.shutdown(wait=False, cancel_futures=True)
+            self._detect_pool = None
+        
         if self.camera:
             self.camera.stop()
         
@@ -599,9 +1058,7 @@ class CalibrationMode:
         
         try:
             marker_id = int(input("Enter marker ID to delete: "))
-            if marker_id in self.navigator.saved_positions:
-                del self.navigator.saved_positions[marker_id]
-                self.navigator.save_positions()
+            if self.navigator.delete_position(marker_id):
                 print(f"✓ Deleted position for marker {marker_id}")
             else:
                 print(f"No saved position for marker {marker_id}")
@@ -624,8 +1081,9 @@ def main():
     
     args = parser.parse_args()
     
-    # Initialize navigator
-    navigator = ArUcoNavigator()
+    # Initialize navigator; only the navigation loop benefits from
+    # detecting in a separate process
+    navigator = ArUcoNavigator(detect_process=bool(args.navigate))
     
     if not navigator.init_camera():
         print("Failed to initialize camera")
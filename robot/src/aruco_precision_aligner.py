@@ -6,13 +6,14 @@ Includes PID control, visual feedback, and position saving
 """
 
 import cv2
+import math
 import numpy as np
 import time
 import logging
 import json
 import os
 import threading
-from typing import Optional, Dict, List, Tuple, Any
+from typing import Optional, List, Tuple, Any
 from dataclasses import dataclass, asdict
 from enum import Enum
 import tkinter as tk
@@ -42,6 +43,15 @@ if HARDWARE_AVAILABLE:
     )
     from motor_gpiozero import BTS7960Motor
 
+try:
+    from numba import njit
+except ImportError:
+    # Numba is optional; without it the error computation runs as plain Python
+    def njit(*args, **kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
 # Setup logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
@@ -75,9 +85,31 @@ class AlignmentTarget:
     def from_dict(cls, data):
         return cls(**data)
 
+# Indices into the alignment error tuple from calculate_alignment_error
+X_ERROR, Y_ERROR, DISTANCE_ERROR, ANGLE_ERROR, X_ERROR_RATIO, Y_ERROR_RATIO = range(6)
+
+@njit(cache=True, fastmath=True)
+def _alignment_errors(center_x, center_y, edge_x, edge_y, distance,
+                      frame_width, frame_height,
+                      target_x_ratio, target_y_ratio, target_distance):
+    """calculate_alignment_error arithmetic, all scalars.
+    
+    Returns:
+        Tuple indexed by X_ERROR .. Y_ERROR_RATIO
+    """
+    x_error = target_x_ratio * frame_width - center_x  # Positive = marker is left of target
+    y_error = target_y_ratio * frame_height - center_y  # Positive = marker is above target
+    distance_error = target_distance - distance
+    # Top edge rotation; the target angle is 0 (edge horizontal)
+    angle_error = math.degrees(math.atan2(edge_y, edge_x))
+    return (x_error, y_error, distance_error, angle_error,
+            x_error / frame_width, y_error / frame_height)
+
 class PIDController:
     """PID controller for smooth control."""
     
+    INTEGRAL_LIMIT = 50.0  # Anti-windup clamp on the accumulated error
+    
     def __init__(self, kp: float, ki: float, kd: float, 
                  output_limits: Tuple[float, float] = (-100, 100)):
         self.kp = kp
@@ -85,19 +117,25 @@ class PIDController:
         self.kd = kd
         self.output_limits = output_limits
         
-        self.integral = 0
-        self.last_error = 0
-        self.last_time = time.time()
+        self.integral = 0.0
+        self.last_error = 0.0
+        self.last_time = time.monotonic()
         
     def reset(self):
         """Reset controller state."""
-        self.integral = 0
-        self.last_error = 0
-        self.last_time = time.time()
-        
-    def update(self, error: float) -> float:
-        """Update PID controller and return output."""
-        current_time = time.time()
+        self.integral = 0.0
+        self.last_error = 0.0
+        self.last_time = time.monotonic()
+        
+    def update(self, error: float, now: Optional[float] = None) -> float:
+        """Update PID controller and return output.
+        
+        Args:
+            error: Current error
+            now: time.monotonic() reading to use, so controllers updated
+                 together can share one clock read
+        """
+        current_time = time.monotonic() if now is None else now
         dt = current_time - self.last_time
         
         if dt <= 0:
@@ -106,10 +144,16 @@ class PIDController:
         # Proportional term
         p_term = self.kp * error
         
-        # Integral term with anti-windup
-        self.integral += error * dt
-        self.integral = np.clip(self.integral, -50, 50)
-        i_term = self.ki * self.integral
+        # Integral term with anti-windup (plain comparisons; np.clip on a
+        # scalar costs more than the rest of the update)
+        integral = self.integral + error * dt
+        limit = self.INTEGRAL_LIMIT
+        if integral > limit:
+            integral = limit
+        elif integral < -limit:
+            integral = -limit
+        self.integral = integral
+        i_term = self.ki * integral
         
         # Derivative term
         d_term = self.kd * (error - self.last_error) / dt
@@ -118,7 +162,11 @@ class PIDController:
         output = p_term + i_term + d_term
         
         # Apply limits
-        output = np.clip(output, self.output_limits[0], self.output_limits[1])
+        low, high = self.output_limits
+        if output > high:
+            output = high
+        elif output < low:
+            output = low
         
         # Update state
         self.last_error = error
@@ -126,9 +174,28 @@ class PIDController:
         
         return output
 
+# Numeric codes for AlignmentState in the alignment history
+_STATE_CODES = {state: float(code) for code, state in enumerate(AlignmentState)}
+
 class RobustAligner:
     """Robust alignment system with multiple control modes."""
     
+    # Alignment history ring buffer: one row per control tick
+    HISTORY_COLUMNS = ('time', 'x_error', 'y_error', 'distance_error', 'angle_error',
+                       'state', 'motor_left', 'motor_right')
+    HISTORY_SIZE = 2048
+    
+    ROI_MARGIN = 0.5  # Crop padding around the last corners, in marker sizes
+    ROI_MARKER_PX = 50  # Crops are shrunk so the marker is about this tall
+    # The marker's perimeter is about 4 / (1 + 2 * ROI_MARGIN) times the
+    # crop side, well past the full-frame detector's limit of 1.0
+    ROI_MAX_PERIMETER_RATE = 4.0
+    
+    # Optical flow tracks are only trusted when every corner passes these
+    TRACK_MAX_ERROR = 20.0  # Mean patch difference reported by LK
+    TRACK_MAX_BACKTRACK_PX = 1.0  # Forward-backward residual
+    TRACK_MIN_MARKER_PX = 10.0  # Smallest tracked marker extent
+    
     def __init__(self, simulation_mode: bool = False):
         self.simulation_mode = simulation_mode or not HARDWARE_AVAILABLE
         
@@ -137,6 +204,15 @@ class RobustAligner:
         self.right_motor = None
         self.camera = None
         self.detector = None
+        self.roi_detector = None  # Full-resolution detector for normalized crops
+        
+        # Motor writes happen on their own thread; the control loop only
+        # stores the latest (left, right) command and wakes it
+        self._motor_cmd = (0.0, 0.0)
+        self._motor_lock = threading.Lock()
+        self._motor_wake = threading.Event()
+        self._motor_running = False
+        self._motor_thread = None
         
         # Control systems
         self.x_controller = PIDController(kp=0.15, ki=0.01, kd=0.05, output_limits=(-40, 40))
@@ -147,7 +223,15 @@ class RobustAligner:
         self.state = AlignmentState.IDLE
         self.current_target = None
         self.last_marker_info = None
-        self.alignment_history = []
+        self._history = np.zeros((self.HISTORY_SIZE, len(self.HISTORY_COLUMNS)),
+                                 dtype=np.float32)
+        self._history_count = 0
+        
+        # Target tracking between full detections (optical flow on corners)
+        self.detect_interval = 3  # Full detection on every Nth frame
+        self._prev_gray = None
+        self._prev_corners = None
+        self._frame_count = 0
         
         # Settings
         self.use_fine_control = True
@@ -185,19 +269,58 @@ class RobustAligner:
             self.left_motor.enable()
             self.right_motor.enable()
             
+            self._motor_running = True
+            self._motor_thread = threading.Thread(
+                target=self._motor_loop, name="motor-writer", daemon=True
+            )
+            self._motor_thread.start()
+            
             logger.info("Motors initialized")
             
         except Exception as e:
             logger.error(f"Failed to initialize hardware: {e}")
             self.simulation_mode = True
             
+    def _motor_loop(self):
+        """Write the latest motor command to the drivers whenever it changes.
+        
+        Commands stored while a write is in progress are coalesced; only the
+        newest is written. Exits after writing the final command once
+        _motor_running is cleared.
+        """
+        while True:
+            self._motor_wake.wait()
+            self._motor_wake.clear()
+            with self._motor_lock:
+                left, right = self._motor_cmd
+                running = self._motor_running
+            try:
+                self.left_motor.drive(left)
+                self.right_motor.drive(right)
+            except Exception as e:
+                logger.error(f"Error setting motor speeds: {e}")
+            if not running:
+                return
+            
     def init_camera(self) -> bool:
         """Initialize camera and detector."""
         try:
             self.camera = CameraInterface()
             if self.camera.is_available():
                 self.camera.start()
+                # Capture on a background thread: the control loop and the
+                # GUI video feed both take the newest frame without blocking
+                # on the driver or reading the device concurrently
+                self.camera.start_async()
                 self.detector = ArUcoDetector(marker_size_cm=MARKER_SIZE_CM)
+                # Crops are already scaled for detection, so no further
+                # downscaling; a separate instance also keeps the full-frame
+                # detector's adaptive scale from seeing crop-sized markers,
+                # and lets the marker fill most of the crop
+                self.roi_detector = ArUcoDetector(
+                    marker_size_cm=MARKER_SIZE_CM, scale=1,
+                    max_perimeter_rate=self.ROI_MAX_PERIMETER_RATE
+                )
                 logger.info("Camera and detector initialized")
                 return True
             else:
@@ -209,19 +332,23 @@ class RobustAligner:
             
     def set_motor_speeds(self, left: float, right: float):
         """Set motor speeds with safety limits."""
-        # Apply speed limits
-        left = np.clip(left, -self.max_speed, self.max_speed)
-        right = np.clip(right, -self.max_speed, self.max_speed)
+        # Apply speed limits (plain comparisons; np.clip on a scalar costs
+        # more than the rest of this method)
+        max_speed = self.max_speed
+        left = -max_speed if left < -max_speed else (max_speed if left > max_speed else left)
+        right = -max_speed if right < -max_speed else (max_speed if right > max_speed else right)
         
         # Apply minimum threshold
-        if abs(left) < self.min_speed and left != 0:
-            left = self.min_speed if left > 0 else -self.min_speed
-        if abs(right) < self.min_speed and right != 0:
-            right = self.min_speed if right > 0 else -self.min_speed
+        min_speed = self.min_speed
+        if 0 < abs(left) < min_speed:
+            left = math.copysign(min_speed, left)
+        if 0 < abs(right) < min_speed:
+            right = math.copysign(min_speed, right)
             
-        if not self.simulation_mode and self.left_motor and self.right_motor:
-            self.left_motor.drive(left)
-            self.right_motor.drive(right)
+        if self._motor_thread is not None:
+            with self._motor_lock:
+                self._motor_cmd = (left, right)
+            self._motor_wake.set()
             
         return left, right
         
@@ -236,8 +363,8 @@ class RobustAligner:
         search_direction = 1
         
         while time.time() - start_time < timeout:
-            # Capture and detect
-            frame, _ = self.camera.capture_frame()
+            # Capture the newest frame and detect
+            frame, _ = self.camera.grab_latest()
             markers = self.detector.detect_markers(frame)
             
             if marker_id in markers:
@@ -258,70 +385,180 @@ class RobustAligner:
         logger.warning(f"Marker {marker_id} not found after {timeout}s")
         return False
         
+    def _reset_tracking(self):
+        """Drop tracked corners so the next frame is fully detected."""
+        self._prev_gray = None
+        self._prev_corners = None
+        self._frame_count = 0
+        
+    def _detect_in_roi(self, gray: np.ndarray, marker_id: int) -> Optional[MarkerInfo]:
+        """Detect the target in a crop around its last corners.
+        
+        The crop is padded by ROI_MARGIN marker sizes and shrunk so the
+        marker is about ROI_MARKER_PX tall; corners are mapped back to
+        full-frame pixels.
+        """
+        quad = self._prev_corners.reshape(4, 2)
+        size = self.detector.marker_from_corners(marker_id, quad).size
+        margin = self.ROI_MARGIN * size
+        frame_h, frame_w = gray.shape
+        x0, y0 = quad.min(axis=0) - margin
+        x1, y1 = quad.max(axis=0) + margin
+        x0, y0 = max(0, int(x0)), max(0, int(y0))
+        x1, y1 = min(frame_w, int(x1) + 1), min(frame_h, int(y1) + 1)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        
+        crop = gray[y0:y1, x0:x1]
+        factor = min(1.0, self.ROI_MARKER_PX / size)
+        if factor < 1.0:
+            crop = cv2.resize(crop, (max(1, int((x1 - x0) * factor)),
+                                     max(1, int((y1 - y0) * factor))),
+                              interpolation=cv2.INTER_AREA)
+        
+        found = self.roi_detector.detect_markers(crop, only_ids={marker_id}).get(marker_id)
+        if found is None:
+            return None
+        
+        scale = np.array([(x1 - x0) / crop.shape[1], (y1 - y0) / crop.shape[0]],
+                         dtype=np.float32)
+        corners = found.corners * scale + np.array([x0, y0], dtype=np.float32)
+        return self.detector.marker_from_corners(marker_id, corners)
+        
+    def _track_corners(self, gray: np.ndarray) -> Optional[np.ndarray]:
+        """Follow the last corners into gray with LK optical flow.
+        
+        Returns:
+            The tracked (4, 1, 2) corners, or None unless every corner was
+            tracked reliably
+        """
+        prev_gray, prev_corners = self._prev_gray, self._prev_corners
+        corners, status, err = cv2.calcOpticalFlowPyrLK(
+            prev_gray, gray, prev_corners, None, winSize=(15, 15), maxLevel=2
+        )
+        if status is None or not status.all() or err.max() > self.TRACK_MAX_ERROR:
+            return None
+        
+        # Track back to the previous frame; drifting corners do not return
+        # to where they started
+        back, status, _ = cv2.calcOpticalFlowPyrLK(
+            gray, prev_gray, corners, None, winSize=(15, 15), maxLevel=2
+        )
+        if (status is None or not status.all() or
+                np.abs(back - prev_corners).max() > self.TRACK_MAX_BACKTRACK_PX):
+            return None
+        
+        # Collapsed corners would give a zero marker size
+        if np.ptp(corners.reshape(4, 2), axis=0).min() < self.TRACK_MIN_MARKER_PX:
+            return None
+        
+        return corners
+        
+    def measure_target(self, frame: np.ndarray, marker_id: int) -> Optional[MarkerInfo]:
+        """Locate the target marker in frame.
+        
+        Runs detection every detect_interval frames; in between, the last
+        corners are followed with pyramidal Lucas-Kanade optical flow. Once
+        the target has been seen, detection first looks in a crop around
+        it and only searches the full frame if that misses. Falls back to
+        detection whenever a corner is lost, drifts (high LK error or
+        forward-backward residual) or the tracked marker collapses.
+        
+        Returns:
+            MarkerInfo for the target, or None if it is not visible
+        """
+        gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+        marker = None
+        
+        if self._prev_corners is not None and self._frame_count % self.detect_interval:
+            corners = self._track_corners(gray)
+            if corners is not None:
+                marker = self.detector.marker_from_corners(marker_id, corners)
+                
+        if marker is None:
+            if self._prev_corners is not None:
+                marker = self._detect_in_roi(gray, marker_id)
+            if marker is None:
+                marker = self.detector.detect_markers(frame, gray).get(marker_id)
+            self._frame_count = 0
+            
+        self._frame_count += 1
+        if marker is None:
+            self._reset_tracking()
+        else:
+            self._prev_gray = gray
+            self._prev_corners = marker.corners.reshape(4, 1, 2).astype(np.float32)
+        return marker
+        
+    def history_view(self) -> np.ndarray:
+        """Alignment history, oldest row first.
+        
+        Returns:
+            (N, len(HISTORY_COLUMNS)) float32 array of the last HISTORY_SIZE
+            control ticks; state is the AlignmentState's position in the enum
+        """
+        count = self._history_count
+        if count <= self.HISTORY_SIZE:
+            return self._history[:count]
+        start = count % self.HISTORY_SIZE
+        return np.concatenate((self._history[start:], self._history[:start]))
+        
     def calculate_alignment_error(self, marker: MarkerInfo, target: AlignmentTarget, 
-                                 frame_shape: Tuple[int, int]) -> Dict[str, float]:
-        """Calculate all alignment errors."""
+                                 frame_shape: Tuple[int, int]) -> Tuple[float, ...]:
+        """Calculate all alignment errors.
+        
+        Returns:
+            Tuple of errors, indexed by X_ERROR, Y_ERROR, DISTANCE_ERROR,
+            ANGLE_ERROR, X_ERROR_RATIO and Y_ERROR_RATIO
+        """
         frame_height, frame_width = frame_shape
         
-        # Position errors
-        target_x = target.target_x_ratio * frame_width
-        target_y = target.target_y_ratio * frame_height
-        
-        x_error = target_x - marker.center[0]  # Positive = marker is left of target
-        y_error = target_y - marker.center[1]  # Positive = marker is above target
-        
-        # Distance error
-        distance_error = target.target_distance_cm - marker.distance
-        
-        # Angle error (if marker corners are available)
-        angle_error = 0
-        if hasattr(marker, 'corners') and marker.corners is not None:
-            # Calculate marker orientation
-            corners = marker.corners[0]
-            # Use top edge to determine rotation
-            top_edge = corners[0] - corners[1]
-            angle = np.degrees(np.arctan2(top_edge[1], top_edge[0]))
-            angle_error = angle  # Assuming target angle is 0
-            
-        return {
-            'x_error': x_error,
-            'y_error': y_error,
-            'distance_error': distance_error,
-            'angle_error': angle_error,
-            'x_error_ratio': x_error / frame_width,
-            'y_error_ratio': y_error / frame_height
-        }
-        
-    def is_aligned(self, errors: Dict[str, float], target: AlignmentTarget) -> bool:
+        # Angle from the top edge (corner 0 -> corner 1), if corners are available
+        edge_x = edge_y = 0.0
+        if marker.corners is not None:
+            (x0, y0), (x1, y1) = np.asarray(marker.corners).reshape(4, 2)[:2].tolist()
+            edge_x = x1 - x0
+            edge_y = y1 - y0
+        
+        return _alignment_errors(
+            float(marker.center[0]), float(marker.center[1]), edge_x, edge_y,
+            float(marker.distance), float(frame_width), float(frame_height),
+            float(target.target_x_ratio), float(target.target_y_ratio),
+            float(target.target_distance_cm)
+        )
+        
+    def is_aligned(self, errors: Tuple[float, ...], target: AlignmentTarget) -> bool:
         """Check if robot is aligned within tolerances."""
         return (
-            abs(errors['x_error']) <= target.tolerance_x_pixels and
-            abs(errors['distance_error']) <= target.tolerance_distance_cm and
-            abs(errors['angle_error']) <= target.tolerance_angle_deg
+            abs(errors[X_ERROR]) <= target.tolerance_x_pixels and
+            abs(errors[DISTANCE_ERROR]) <= target.tolerance_distance_cm and
+            abs(errors[ANGLE_ERROR]) <= target.tolerance_angle_deg
         )
         
-    def calculate_motor_speeds(self, errors: Dict[str, float], mode: str = 'fine') -> Tuple[float, float]:
+    def calculate_motor_speeds(self, errors: Tuple[float, ...], mode: str = 'fine') -> Tuple[float, float]:
         """Calculate motor speeds based on errors and control mode."""
         if mode == 'coarse':
             # Simple proportional control for coarse alignment
-            turn_speed = errors['x_error_ratio'] * 40
-            forward_speed = errors['distance_error'] * 2
+            turn_speed = errors[X_ERROR_RATIO] * 40
+            forward_speed = errors[DISTANCE_ERROR] * 2
             
             left = forward_speed - turn_speed
             right = forward_speed + turn_speed
             
         else:  # fine control
-            # Use PID controllers
-            turn_control = self.x_controller.update(errors['x_error'])
-            forward_control = self.distance_controller.update(errors['distance_error'])
+            # Use PID controllers, all stepped at the same instant
+            now = time.monotonic()
+            turn_control = self.x_controller.update(errors[X_ERROR], now)
+            forward_control = self.distance_controller.update(errors[DISTANCE_ERROR], now)
             
             # Combine controls
             left = forward_control - turn_control
             right = forward_control + turn_control
             
             # Add angle correction if significant
-            if abs(errors['angle_error']) > 5:
-                angle_control = self.angle_controller.update(errors['angle_error'])
+            angle_error = errors[ANGLE_ERROR]
+            if abs(angle_error) > 5:
+                angle_control = self.angle_controller.update(angle_error, now)
                 left -= angle_control
                 right += angle_control
                 
@@ -343,6 +580,8 @@ class RobustAligner:
         self.distance_controller.reset()
         self.angle_controller.reset()
         
+        self._reset_tracking()
+        
         # Search for marker first
         if not self.search_for_marker(target.marker_id, timeout=10):
             self.state = AlignmentState.ERROR
@@ -353,29 +592,29 @@ class RobustAligner:
         required_aligned_frames = 10  # Must be aligned for this many consecutive frames
         
         while time.time() - start_time < timeout:
-            # Capture and detect
-            frame, _ = self.camera.capture_frame()
-            markers = self.detector.detect_markers(frame)
+            # Capture the newest frame and locate the target
+            frame, _ = self.camera.grab_latest()
+            marker = self.measure_target(frame, target.marker_id)
             
-            if target.marker_id not in markers:
+            if marker is None:
                 logger.warning("Lost marker, searching again...")
                 if not self.search_for_marker(target.marker_id, timeout=5):
                     self.state = AlignmentState.ERROR
                     return False
                 continue
                 
-            marker = markers[target.marker_id]
             self.last_marker_info = marker
             
             # Calculate errors
             errors = self.calculate_alignment_error(marker, target, frame.shape[:2])
             
-            # Record history
-            self.alignment_history.append({
-                'time': time.time() - start_time,
-                'errors': errors,
-                'state': self.state.value
-            })
+            # Record history; motor columns are filled in once speeds are set
+            row = self._history[self._history_count % self.HISTORY_SIZE]
+            self._history_count += 1
+            row[:5] = (time.time() - start_time, errors[X_ERROR], errors[Y_ERROR],
+                       errors[DISTANCE_ERROR], errors[ANGLE_ERROR])
+            row[5] = _STATE_CODES[self.state]
+            row[6] = row[7] = 0.0
             
             # Check if aligned
             if self.is_aligned(errors, target):
@@ -390,7 +629,7 @@ class RobustAligner:
                 
             # Determine control mode
             if self.state == AlignmentState.COARSE_ALIGNMENT:
-                if abs(errors['distance_error']) < 10 and abs(errors['x_error_ratio']) < 0.2:
+                if abs(errors[DISTANCE_ERROR]) < 10 and abs(errors[X_ERROR_RATIO]) < 0.2:
                     self.state = AlignmentState.FINE_ALIGNMENT
                     logger.info("Switching to fine alignment")
                     # Reset PID controllers for fine mode
@@ -403,6 +642,8 @@ class RobustAligner:
             
             # Apply speeds
             actual_left, actual_right = self.set_motor_speeds(left, right)
+            row[6] = actual_left
+            row[7] = actual_right
             
             # Callback for UI updates
             if callback:
@@ -483,10 +724,24 @@ class RobustAligner:
         """Clean up resources."""
         self.stop_motors()
         
+        # The motor thread writes the stop command, then exits
+        motors_idle = True
+        if self._motor_thread is not None:
+            with self._motor_lock:
+                self._motor_running = False
+            self._motor_wake.set()
+            self._motor_thread.join(timeout=1.0)
+            if self._motor_thread.is_alive():
+                # Still inside drive(); releasing the pins under it would race
+                logger.error("Motor thread did not stop; leaving motors enabled")
+                motors_idle = False
+            else:
+                self._motor_thread = None
+        
         if self.camera:
             self.camera.stop()
             
-        if not self.simulation_mode:
+        if not self.simulation_mode and motors_idle:
             if self.left_motor:
                 self.left_motor.disable()
                 self.left_motor.cleanup()
@@ -503,6 +758,9 @@ class AlignmentGUI:
         self.root.geometry("1000x700")
         
         self.aligner = RobustAligner()
+        # The video feed runs alongside the alignment thread; ArUcoDetector
+        # reuses per-frame buffers, so the feed gets a detector of its own
+        self.feed_detector = ArUcoDetector(marker_size_cm=MARKER_SIZE_CM)
         self.current_frame = None
         self.is_aligning = False
         self.alignment_thread = None
@@ -612,8 +870,8 @@ class AlignmentGUI:
                 
                 # Detect markers
                 if self.aligner.detector:
-                    markers = self.aligner.detector.detect_markers(frame)
-                    frame = self.aligner.detector.draw_markers(frame, markers)
+                    markers = self.feed_detector.detect_markers(frame)
+                    frame = self.feed_detector.draw_markers(frame, markers)
                     
                     # Draw alignment target
                     self.draw_alignment_target(frame)
@@ -690,9 +948,9 @@ class AlignmentGUI:
         """Update status displays."""
         # Update error labels
         errors = data['errors']
-        self.x_error_label.config(text=f"X Error: {errors['x_error']:.1f} px")
-        self.distance_error_label.config(text=f"Distance Error: {errors['distance_error']:.1f} cm")
-        self.angle_error_label.config(text=f"Angle Error: {errors['angle_error']:.1f}°")
+        self.x_error_label.config(text=f"X Error: {errors[X_ERROR]:.1f} px")
+        self.distance_error_label.config(text=f"Distance Error: {errors[DISTANCE_ERROR]:.1f} cm")
+        self.angle_error_label.config(text=f"Angle Error: {errors[ANGLE_ERROR]:.1f}°")
         
         # Update progress
         self.progress['value'] = data['aligned_count']
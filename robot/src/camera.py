@@ -1,7 +1,9 @@
 """Camera interface using OpenCV for USB cameras on BevBot."""
 
+import re
 import time
 import logging
+import threading
 from typing import Generator, Tuple, Optional, List
 import numpy as np
 
@@ -34,6 +36,17 @@ class CameraInterface:
         self._camera: Optional[cv2.VideoCapture] = None
         self._is_running = False
         self._device_path = None
+        self._stale_frames = 0  # Frames the driver may still queue ahead of the newest
+        self.frames_dropped = 0
+        
+        # Background capture: the worker keeps only the most recent frame
+        self._capture_thread: Optional[threading.Thread] = None
+        self._capture_stop = threading.Event()
+        self._frame_ready = threading.Event()
+        self._latest_lock = threading.Lock()
+        self._latest_changed = threading.Condition(self._latest_lock)
+        self._latest: Optional[Tuple[np.ndarray, float]] = None
+        self._async_gray = False  # Worker publishes grayscale instead of BGR
         
     def start(self) -> None:
         """Start the USB camera and configure it."""
@@ -100,10 +113,24 @@ class CameraInterface:
                 raise RuntimeError("Cannot open any USB camera device")
                 
             self._device_path = working_path
+            self._configure_v4l2()
             
-            # Configure camera resolution (like working script)
-            self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
-            self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+            # The driver kept a deeper queue: a leaky GStreamer pipeline that
+            # holds a single frame does what BUFFERSIZE could not. The device
+            # only streams to one reader, so the V4L2 capture is released
+            # first and reopened if the pipeline fails
+            if self._stale_frames and isinstance(working_path, str):
+                self._camera.release()
+                self._camera = None
+                pipeline = self._open_leaky_pipeline(working_path)
+                if pipeline is not None:
+                    self._camera = pipeline
+                    self._stale_frames = 0
+                else:
+                    self._camera = cv2.VideoCapture(working_path, cv2.CAP_V4L2)
+                    if not self._camera.isOpened():
+                        raise RuntimeError(f"Cannot reopen camera: {working_path}")
+                    self._configure_v4l2()
             
             # Get actual resolution
             actual_width = int(self._camera.get(cv2.CAP_PROP_FRAME_WIDTH))
@@ -122,12 +149,168 @@ class CameraInterface:
             self._cleanup()
             raise
             
+    def _configure_v4l2(self) -> None:
+        """Apply resolution and queue depth to the V4L2 capture."""
+        # Configure camera resolution (like working script)
+        self._camera.set(cv2.CAP_PROP_FRAME_WIDTH, self.width)
+        self._camera.set(cv2.CAP_PROP_FRAME_HEIGHT, self.height)
+        
+        # Keep the driver queue as short as possible so reads return the
+        # newest exposure; some backends ignore this, so remember how many
+        # queued frames grab_latest() has to skip
+        self._camera.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        buffered = int(self._camera.get(cv2.CAP_PROP_BUFFERSIZE))
+        self._stale_frames = max(buffered - 1, 0)
+        
+    def _open_leaky_pipeline(self, device: str) -> Optional["cv2.VideoCapture"]:
+        """Open device through a GStreamer pipeline that keeps one frame.
+        
+        The device must not be open elsewhere. MJPG is tried first, since
+        USB cameras usually offer high resolutions only in that format,
+        then raw video.
+        
+        Returns:
+            The opened capture, or None if OpenCV has no GStreamer support
+            or no pipeline delivers frames
+        """
+        if not re.search(r'GStreamer:\s*YES', cv2.getBuildInformation()):
+            logger.info("Driver ignores CAP_PROP_BUFFERSIZE and OpenCV has no "
+                        "GStreamer; stale frames will be skipped on read")
+            return None
+            
+        size = f"width={self.width},height={self.height}"
+        sources = (
+            f"image/jpeg,{size} ! jpegdec",
+            f"video/x-raw,{size}",
+        )
+        for source in sources:
+            pipeline = (
+                f"v4l2src device={device} ! {source} ! "
+                "queue leaky=downstream max-size-buffers=1 ! videoconvert ! "
+                "appsink drop=true max-buffers=1 sync=false"
+            )
+            capture = cv2.VideoCapture(pipeline, cv2.CAP_GSTREAMER)
+            if capture.isOpened():
+                ret, frame = capture.read()
+                if ret and frame is not None:
+                    logger.info("Driver ignores CAP_PROP_BUFFERSIZE; using leaky "
+                                f"GStreamer pipeline ({source.split(',')[0]})")
+                    return capture
+            capture.release()
+        logger.warning("GStreamer fallback pipeline failed; stale frames will be skipped on read")
+        return None
+        
     def stop(self) -> None:
         """Stop the camera."""
+        self.stop_async()
         if self._camera is not None:
             logger.info("Stopping camera")
             self._cleanup()
             
+    def start_async(self, gray: bool = False) -> None:
+        """Capture frames continuously on a background thread.
+        
+        Only the newest frame is kept. While running, capture_frame() and
+        grab_latest() return that frame instead of reading the device, so
+        consumers never block on the driver and never see stale frames.
+        
+        Args:
+            gray: Convert each frame to grayscale on the capture thread and
+                  publish that instead of BGR. For detection-only consumers,
+                  so the conversion overlaps with their processing.
+        """
+        if self._capture_thread is not None:
+            return
+        if not self._is_running or self._camera is None:
+            raise RuntimeError("Camera not started")
+            
+        self._async_gray = gray
+        self._capture_stop.clear()
+        self._frame_ready.clear()
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="camera-capture", daemon=True
+        )
+        self._capture_thread.start()
+        logger.info("Background frame capture started")
+        
+    def stop_async(self) -> None:
+        """Stop the background capture thread if it is running."""
+        if self._capture_thread is None:
+            return
+            
+        self._capture_stop.set()
+        self._capture_thread.join(timeout=1.0)
+        self._capture_thread = None
+        with self._latest_lock:
+            self._latest = None
+        logger.info("Background frame capture stopped")
+        
+    def _capture_loop(self) -> None:
+        """Background worker publishing the most recent frame."""
+        while not self._capture_stop.is_set():
+            try:
+                ret, frame = self._camera.read()
+            except Exception as e:
+                logger.error(f"Background capture error: {e}")
+                ret, frame = False, None
+                
+            if not ret or frame is None:
+                time.sleep(0.01)
+                continue
+                
+            if self._async_gray:
+                frame = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY)
+                
+            with self._latest_changed:
+                self._latest = (frame, time.time())
+                self._latest_changed.notify_all()
+            self._frame_ready.set()
+            
+    def latest_frame(self, timeout: float = 1.0) -> Tuple[np.ndarray, float]:
+        """Get the most recent frame published by the background thread.
+        
+        Args:
+            timeout: Seconds to wait for the first frame after start_async()
+            
+        Returns:
+            Tuple of (frame_array, timestamp) - frame in BGR format, or
+            grayscale if started with start_async(gray=True)
+        """
+        if not self._frame_ready.wait(timeout):
+            raise RuntimeError("No frame available from background capture")
+            
+        with self._latest_lock:
+            latest = self._latest
+            
+        if latest is None:
+            raise RuntimeError("Background capture not running")
+            
+        return latest
+            
+    def wait_for_frame(self, after: Optional[float] = None,
+                       timeout: float = 1.0) -> Tuple[np.ndarray, float]:
+        """Wait for a background-captured frame newer than `after`.
+        
+        For loops that should process each camera frame at most once.
+        
+        Args:
+            after: Timestamp of the last frame the caller processed, or None
+                   to take whatever is newest
+            timeout: Seconds to wait for a new frame
+            
+        Returns:
+            Tuple of (frame_array, timestamp), as for latest_frame()
+        """
+        if self._capture_thread is None:
+            raise RuntimeError("Background capture not running")
+            
+        with self._latest_changed:
+            if not self._latest_changed.wait_for(
+                    lambda: self._latest is not None and self._latest[1] != after,
+                    timeout):
+                raise RuntimeError("No new frame from background capture")
+            return self._latest
+            
     def _cleanup(self) -> None:
         """Clean up camera resources."""
         try:
@@ -143,11 +326,15 @@ class CameraInterface:
         """Capture a single frame.
         
         Returns:
-            Tuple of (frame_array, timestamp) - frame in BGR format
+            Tuple of (frame_array, timestamp) - frame in BGR format, or
+            grayscale while started with start_async(gray=True)
         """
         if not self._is_running or self._camera is None:
             raise RuntimeError("Camera not started")
             
+        if self._capture_thread is not None:
+            return self.latest_frame()
+            
         # Simple frame capture like working script
         ret, frame = self._camera.read()
         timestamp = time.time()
@@ -157,6 +344,50 @@ class CameraInterface:
             
         return frame, timestamp
         
+    def grab_latest(self) -> Tuple[np.ndarray, float]:
+        """Capture the newest available frame, dropping any queued ones.
+        
+        Use this from control loops that are slower than the camera frame
+        rate so they never act on stale frames.
+        
+        Returns:
+            Tuple of (frame_array, timestamp) - frame in BGR format, or
+            grayscale while started with start_async(gray=True)
+        """
+        if not self._is_running or self._camera is None:
+            raise RuntimeError("Camera not started")
+            
+        if self._capture_thread is not None:
+            return self.latest_frame()
+            
+        for _ in range(self._stale_frames):
+            self._camera.grab()
+        self.frames_dropped += self._stale_frames
+        
+        ret, frame = self._camera.read()
+        timestamp = time.time()
+        
+        if not ret or frame is None:
+            raise RuntimeError("Failed to capture frame from USB camera")
+            
+        return frame, timestamp
+        
+    def capture_gray(self) -> Tuple[np.ndarray, float]:
+        """Capture a single frame as a grayscale plane.
+        
+        Consumers that only run marker detection can use this instead of
+        capture_frame() and hand the result straight to the detector, so the
+        BGR frame is reduced to one channel exactly once per capture.
+        
+        Returns:
+            Tuple of (gray_array, timestamp) - single-channel uint8 frame
+        """
+        frame, timestamp = self.capture_frame()
+        if frame.ndim == 2:
+            # Already converted by the background capture thread
+            return frame, timestamp
+        return cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY), timestamp
+        
     def capture_stream(self) -> Generator[Tuple[np.ndarray, float], None, None]:
         """Continuous frame capture generator.
         
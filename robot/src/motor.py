@@ -84,19 +84,33 @@ class BTS7960:
             self._enabled = True
             logger.info(f"{self.motor_type} motor enabled")
             
+    def _outputs_off(self) -> None:
+        """Zero both PWM channels, then drop the enable pins."""
+        pi = self._get_pi()
+        # Stop PWM first
+        pi.set_PWM_dutycycle(self.rpwm, 0)
+        pi.set_PWM_dutycycle(self.lpwm, 0)
+        # Disable motor driver
+        pi.write(self.r_en, 0)
+        pi.write(self.l_en, 0)
+        self._enabled = False
+            
     def disable(self) -> None:
         """Disable the motor driver and stop PWM."""
         if self._enabled:
-            pi = self._get_pi()
-            # Stop PWM first
-            pi.set_PWM_dutycycle(self.rpwm, 0)
-            pi.set_PWM_dutycycle(self.lpwm, 0)
-            # Disable motor driver
-            pi.write(self.r_en, 0)
-            pi.write(self.l_en, 0)
-            self._enabled = False
+            self._outputs_off()
             logger.info(f"{self.motor_type} motor disabled")
             
+    def shutdown(self) -> None:
+        """Stop and disable the motor in one step.
+        
+        Equivalent to stop() followed by disable(), without driving zero
+        twice.
+        """
+        if self._enabled:
+            self._outputs_off()
+            logger.info(f"{self.motor_type} motor shutdown")
+            
     def brake(self) -> None:
         """Apply electrical brake (both PWMs high)."""
         if not self._enabled:
@@ -105,7 +119,7 @@ class BTS7960:
         pi = self._get_pi()
         pi.set_PWM_dutycycle(self.rpwm, 255)
         pi.set_PWM_dutycycle(self.lpwm, 255)
-        logger.debug(f"{self.motor_type} motor braking")
+        logger.debug("%s motor braking", self.motor_type)
         
     def drive(self, percent: float) -> None:
         """Drive motor at specified power percentage.
@@ -134,13 +148,13 @@ class BTS7960:
             pi.set_PWM_dutycycle(self.rpwm, 0)
             pi.set_PWM_dutycycle(self.lpwm, pwm_value)
             
-        logger.debug(f"{self.motor_type} motor drive: {percent}%")
+        logger.debug("%s motor drive: %s%%", self.motor_type, percent)
         
     def stop(self) -> None:
         """Stop motor (coast to stop)."""
         if self._enabled:
             self.drive(0)
-            logger.debug(f"{self.motor_type} motor stopped")
+            logger.debug("%s motor stopped", self.motor_type)
             
     def __enter__(self):
         """Context manager entry."""
@@ -150,8 +164,7 @@ class BTS7960:
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit - ensure safe shutdown."""
         try:
-            self.stop()
-            self.disable()
+            self.shutdown()
         except Exception as e:
             logger.error(f"Error during motor shutdown: {e}")
         finally:
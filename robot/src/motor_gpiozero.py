@@ -37,6 +37,11 @@ class BTS7960Motor:
         self.rpwm = PWMOutputDevice(rpwm_pin, frequency=1000)
         self.lpwm = PWMOutputDevice(lpwm_pin, frequency=1000)
         
+        # Last values written to each PWM channel, so unchanged channels
+        # are not rewritten on every drive() call
+        self._rpwm_value = None
+        self._lpwm_value = None
+        
         # Start with motor disabled
         self._enabled = False
         self.disable()
@@ -48,26 +53,62 @@ class BTS7960Motor:
         self._enabled = True
         logger.info(f"{self.name} motor enabled")
         
-    def disable(self) -> None:
-        """Disable the motor driver and stop PWM."""
+    def _write_pwm(self, rpwm_value: float, lpwm_value: float) -> None:
+        """Write both PWM channels, skipping any that already hold the value.
+        
+        A channel going to zero is written first, so RPWM and LPWM are never
+        both driven while switching direction.
+        """
+        if rpwm_value == 0:
+            if self._rpwm_value != rpwm_value:
+                self._rpwm_value = None  # Unknown until the write succeeds
+                self.rpwm.value = rpwm_value
+                self._rpwm_value = rpwm_value
+            if self._lpwm_value != lpwm_value:
+                self._lpwm_value = None
+                self.lpwm.value = lpwm_value
+                self._lpwm_value = lpwm_value
+        else:
+            if self._lpwm_value != lpwm_value:
+                self._lpwm_value = None
+                self.lpwm.value = lpwm_value
+                self._lpwm_value = lpwm_value
+            if self._rpwm_value != rpwm_value:
+                self._rpwm_value = None
+                self.rpwm.value = rpwm_value
+                self._rpwm_value = rpwm_value
+        
+    def _outputs_off(self) -> None:
+        """Zero both PWM channels, then drop the enable pins."""
         # Stop PWM first
-        self.rpwm.value = 0
-        self.lpwm.value = 0
+        self._write_pwm(0, 0)
         
         # Disable motor driver
         self.r_en.off()
         self.l_en.off()
         self._enabled = False
+        
+    def disable(self) -> None:
+        """Disable the motor driver and stop PWM."""
+        self._outputs_off()
         logger.info(f"{self.name} motor disabled")
         
+    def shutdown(self) -> None:
+        """Stop and disable the motor in one step.
+        
+        Equivalent to stop() followed by disable(), without driving zero
+        twice.
+        """
+        self._outputs_off()
+        logger.info(f"{self.name} motor shutdown")
+        
     def brake(self) -> None:
         """Apply electrical brake (both PWMs high)."""
         if not self._enabled:
             raise RuntimeError(f"{self.name} motor must be enabled before braking")
             
-        self.rpwm.value = 1.0
-        self.lpwm.value = 1.0
-        logger.debug(f"{self.name} motor braking")
+        self._write_pwm(1.0, 1.0)
+        logger.debug("%s motor braking", self.name)
         
     def drive(self, percent: float) -> None:
         """Drive motor at specified power percentage.
@@ -90,30 +131,26 @@ class BTS7960Motor:
         
         if percent == 0:
             # Coast - both PWMs off
-            self.rpwm.value = 0
-            self.lpwm.value = 0
+            self._write_pwm(0, 0)
         elif percent > 0:
             # Forward - RPWM active, LPWM off
-            self.lpwm.value = 0
-            self.rpwm.value = pwm_value
+            self._write_pwm(pwm_value, 0)
         else:
             # Reverse - LPWM active, RPWM off
-            self.rpwm.value = 0
-            self.lpwm.value = pwm_value
+            self._write_pwm(0, pwm_value)
             
-        logger.debug(f"{self.name} motor drive: {percent}% (inverted: {self.invert})")
+        logger.debug("%s motor drive: %s%% (inverted: %s)", self.name, percent, self.invert)
         
     def stop(self) -> None:
         """Stop motor (coast to stop)."""
         if self._enabled:
             self.drive(0)
-            logger.debug(f"{self.name} motor stopped")
+            logger.debug("%s motor stopped", self.name)
             
     def cleanup(self) -> None:
         """Clean up GPIO resources."""
         try:
-            self.stop()
-            self.disable()
+            self.shutdown()
         except Exception as e:
             logger.error(f"Error during {self.name} motor cleanup: {e}")
         finally:
@@ -7,7 +7,6 @@ import logging
 import os
 from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass
-import cv2
 import numpy as np
 from io import BytesIO
 import time
@@ -85,6 +84,8 @@ class OpenAIVision:
         Returns:
             Base64 encoded image string
         """
+        import cv2  # Deferred: only needed once an image is actually sent
+
         # Convert to JPEG
         success, buffer = cv2.imencode('.jpg', image)
         if not success:
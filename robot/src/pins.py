@@ -31,8 +31,20 @@ def clamp_pwm_percent(percent: float) -> float:
     """Clamp PWM percentage to safe range 0-100%."""
     return max(0.0, min(100.0, percent))
 
+# PWM value for each whole percent; routines command the pigpio drivers with
+# fixed setpoints such as 30 or 50
+_PWM_VALUES = tuple(int((percent / 100.0) * PWM_RANGE) for percent in range(101))
+
 def percent_to_pwm_value(percent: float) -> int:
-    """Convert percentage (0-100) to PWM value (0-255)."""
+    """Convert percentage (0-100) to PWM value (0-255).
+    
+    Whole percents are looked up in a precomputed table; other values
+    (e.g. from a PID) are computed.
+    """
+    if 0 <= percent <= 100:
+        whole = int(percent)
+        if whole == percent:
+            return _PWM_VALUES[whole]
     clamped = clamp_pwm_percent(percent)
     return int((clamped / 100.0) * PWM_RANGE)
 
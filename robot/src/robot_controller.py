@@ -188,14 +188,12 @@ class RobotController:
         
         if not self.simulation_mode:
             try:
+                # cleanup() shuts each driver down before closing its pins
                 if self.left_motor:
-                    self.left_motor.disable()
                     self.left_motor.cleanup()
                 if self.right_motor:
-                    self.right_motor.disable()
                     self.right_motor.cleanup()
                 if self.actuator:
-                    self.actuator.disable()
                     self.actuator.cleanup()
             except Exception as e:
                 logger.error(f"Error during cleanup: {e}")
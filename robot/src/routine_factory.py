@@ -3,6 +3,7 @@
 
 import json
 import logging
+import os
 from typing import Dict, Any, List, Type
 from pathlib import Path
 
@@ -233,9 +234,16 @@ class RoutineManager:
                 'actions': [ActionFactory.action_to_dict(a) for a in sub.actions]
             }
         
-        # Save to file
-        with open(filepath, 'w') as f:
-            json.dump(routine_dict, f, indent=2)
+        # Write to a temp file and rename over the target so an interrupted
+        # save never leaves a truncated routine behind
+        tmp_path = filepath.with_name(filepath.name + '.tmp')
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(routine_dict, f, indent=2)
+            os.replace(tmp_path, filepath)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
         
         logger.info(f"Saved routine '{routine.name}' to {filepath}")
         return str(filepath)
@@ -42,6 +42,7 @@ class RoutineNavigator:
         logger.info(f"Navigating to marker {goal.marker_id} with approach {goal.approach.value}")
         
         start_time = time.time()
+        dropped_at_start = self.camera.frames_dropped
         
         # First, find the marker
         if not self._search_for_marker(goal.marker_id, timeout=min(10, timeout/3)):
@@ -54,7 +55,7 @@ class RoutineNavigator:
         # Navigate to target position
         while time.time() - start_time < timeout:
             # Get current marker position
-            frame, _ = self.camera.capture_frame()
+            frame, _ = self.camera.grab_latest()
             markers = self.detector.detect_markers(frame)
             
             if goal.marker_id not in markers:
@@ -81,6 +82,7 @@ class RoutineNavigator:
                     self._align_to_marker(marker, target_angle)
                 
                 self.robot.stop_motors()
+                logger.info(f"Dropped {self.camera.frames_dropped - dropped_at_start} stale frames")
                 return True
             
             # Navigate towards target
@@ -93,6 +95,7 @@ class RoutineNavigator:
             time.sleep(0.1)
         
         logger.error("Navigation timeout")
+        logger.info(f"Dropped {self.camera.frames_dropped - dropped_at_start} stale frames")
         self.robot.stop_motors()
         return False
     
@@ -115,7 +118,7 @@ class RoutineNavigator:
         self.robot.set_motor_speeds(-search_speed, search_speed)
         
         while time.time() - start_time < timeout:
-            frame, _ = self.camera.capture_frame()
+            frame, _ = self.camera.grab_latest()
             markers = self.detector.detect_markers(frame)
             
             if marker_id in markers:
@@ -270,7 +273,7 @@ class RoutineNavigator:
             time.sleep(0.2)
             
             # Re-detect marker
-            frame, _ = self.camera.capture_frame()
+            frame, _ = self.camera.grab_latest()
             markers = self.detector.detect_markers(frame)
             if marker.id in markers:
                 marker = markers[marker.id]
@@ -303,6 +306,6 @@ class RoutineNavigator:
         Returns:
             MarkerInfo if visible, None otherwise
         """
-        frame, _ = self.camera.capture_frame()
+        frame, _ = self.camera.grab_latest()
         markers = self.detector.detect_markers(frame)
         return markers.get(marker_id)
\ No newline at end of file
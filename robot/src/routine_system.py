@@ -407,6 +407,9 @@ class LoopAction(Action):
 class RoutineContext:
     """Execution context for routines."""
     
+    # Read by every action tick; fixed slots avoid a per-instance __dict__
+    __slots__ = ('robot', 'navigator', 'camera', 'variables', 'detector')
+    
     def __init__(self, robot, navigator=None, camera=None):
         """Initialize routine context.
         
@@ -163,10 +163,19 @@ print("\n5. Testing OpenCV and ArUco...")
 try:
     import cv2
     print(f"   OpenCV version: {cv2.__version__}")
+    parallel = [line.strip() for line in cv2.getBuildInformation().splitlines()
+                if line.strip().startswith('Parallel framework')]
+    if parallel:
+        print(f"   {parallel[0]}")
+    print(f"   OpenCV threads: {cv2.getNumThreads()}")
     
     # Test ArUco dictionary
-    aruco_dict = cv2.aruco.Dictionary_get(cv2.aruco.DICT_4X4_50)
+    aruco_dict = cv2.aruco.getPredefinedDictionary(cv2.aruco.DICT_4X4_50)
     print("   [OK] ArUco dictionary loaded")
+    if hasattr(cv2.aruco, 'ArucoDetector'):
+        print("   [OK] ArucoDetector API available (OpenCV 4.7+)")
+    else:
+        print("   [WARNING] Legacy ArUco API only, detection is slower")
     
     from aruco_center_demo import ArUcoDetector
     detector = ArUcoDetector(marker_size_cm=10.0)